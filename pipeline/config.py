@@ -24,9 +24,17 @@ DB_URL: str = os.environ.get(
     "postgresql://hackeurope:hackeurope@db:5432/hackeurope"
 )
 
+# Rows per INSERT statement for execute_values call sites that don't use COPY
+EXECUTE_VALUES_PAGE_SIZE: int = int(os.environ.get("EXECUTE_VALUES_PAGE_SIZE", "10000"))
+
 # ── Data root ─────────────────────────────────────────────────
 DATA_ROOT = Path(os.environ.get("DATA_ROOT", "/data"))
 
+# On-disk cache for derived artefacts (projected tiles, geocoded PPR, ...)
+# Lives on the /data volume so it survives `docker compose run --rm`.
+# Safe to delete — every entry is keyed by its inputs and rebuilt on miss.
+CACHE_DIR = Path(os.environ.get("PIPELINE_CACHE_DIR", DATA_ROOT / ".cache"))
+
 # ── Grid ──────────────────────────────────────────────────────
 IRELAND_BOUNDARY_FILE = DATA_ROOT / "grid" / "ireland_boundary.gpkg"
 # Ireland national boundary in EPSG:2157 (ITM) — source: OSi / CSO
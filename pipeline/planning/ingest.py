@@ -26,16 +26,26 @@ zoning_tier = 0–100 score based on best zoning category present
 planning_precedent = 0–100 score based on proximity to previous DC applications
 
 IDA sites come from ida_sites table (manually entered — DO NOT overwrite from here).
-nearest_ida_site_km computed via PostGIS query or geopandas spatial join.
+nearest_ida_site_km computed via a PostGIS KNN query (LATERAL … ORDER BY <-> LIMIT 1, then ST_DWithin).
 """
 
+import csv
+import hashlib
+import io
+import logging
+import pickle
 import sys
-from collections import defaultdict
 from pathlib import Path
+import ahocorasick
 import numpy as np
 import geopandas as gpd
 import pandas as pd
+import pyarrow.csv as pacsv
+import pyogrio
+import shapely
 import sqlalchemy
+from scipy.spatial import cKDTree
+from shapely.strtree import STRtree
 from sqlalchemy import text
 from tqdm import tqdm
 import psycopg2
@@ -44,9 +54,11 @@ from psycopg2.extras import execute_values
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import (
     DB_URL, MYPLAN_ZONING_FILE, PLANNING_APPLICATIONS_FILE,
-    CSO_POPULATION_FILE, PPR_FILE, OSM_SETTLEMENTS_FILE, GRID_CRS_ITM
+    CSO_POPULATION_FILE, PPR_FILE, OSM_SETTLEMENTS_FILE, GRID_CRS_ITM, CACHE_DIR
 )
 
+log = logging.getLogger("planning.ingest")
+
 # Zoning category mapping — MyPlan GZT codes to our categories
 ZONING_MAP = {
     "Industrial": "industrial",
@@ -67,23 +79,116 @@ ZONING_MAP = {
     "R": "residential",
 }
 
+# Fallback for codes not in ZONING_MAP — first keyword found (in this order) wins
+ZONING_KEYWORDS = [
+    ("industrial", "industrial"),
+    ("enterprise", "enterprise"),
+    ("mixed", "mixed_use"),
+    ("agri", "agricultural"),
+    ("resid", "residential"),
+]
+
+# Planning application types treated as DC-related (regex on lowercased type)
+DC_TYPE_PATTERN = "data.cent|industrial|technolog"
+
+# Lower bound on metres per planar EPSG:4326 degree anywhere in Ireland (a
+# degree of longitude at 55.5°N is ~63 km); turns an ITM distance into a
+# degree radius that can't miss a nearer site (see compute_nearest_ida_km)
+IDA_MIN_M_PER_DEG = 60_000.0
+
+# Folded into the geocoded-PPR cache key (see _load_geocoded_ppr). Bump it
+# whenever the cleaning, geocoding or price/m² logic changes, so caches
+# written by older code are not reused just because the inputs are unchanged.
+PPR_CACHE_VERSION = 2
+
+# Every attribute the _find_col lookups below may pick from the zoning /
+# applications sources (matched case-insensitively). main() reads only these.
+ZONING_READ_COLS = ["CATEGORY", "GZT_CODE", "ZONE_TYPE", "ZONING", "LandUseZoning"]
+APPLICATION_READ_COLS = [
+    "APP_REF", "PlanRef", "REF", "Reference",
+    "APP_TYPE", "DevType", "TYPE",
+    "STATUS", "Decision",
+    "APP_DATE", "DecDate", "DATE",
+    "NAME", "DESCRIPTION",
+]
+
+
+def _bulk_upsert(cur, table: str, df: pd.DataFrame, conflict_key: str) -> int:
+    """
+    Upsert df into table via COPY into a temp staging table, then a single
+    INSERT ... SELECT ... ON CONFLICT (conflict_key) DO UPDATE.
 
-def _to_py(val):
-    """Convert numpy scalar / NaN to Python native type for psycopg2."""
-    if val is None:
-        return None
-    try:
-        if pd.isna(val):
-            return None
-    except (TypeError, ValueError):
-        pass
-    if isinstance(val, np.integer):
-        return int(val)
-    if isinstance(val, np.floating):
-        return float(val)
-    if isinstance(val, np.bool_):
-        return bool(val)
-    return val
+    df columns must match table column names and hold numeric data only:
+    rows go over in COPY's tab-separated TEXT format (no quote parsing) with
+    NaN / pd.NA written as \\N. Returns row count.
+    """
+    cols = list(df.columns)
+    col_list = ", ".join(cols)
+    updates = ",\n            ".join(f"{c} = EXCLUDED.{c}" for c in cols if c != conflict_key)
+    stage = f"{table}_stage"
+
+    cur.execute(f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+
+    buf = io.StringIO()
+    df.to_csv(buf, sep="\t", na_rep="\\N", index=False, header=False,
+              quoting=csv.QUOTE_NONE)
+    buf.seek(0)
+    cur.copy_expert(f"COPY {stage} ({col_list}) FROM STDIN", buf)
+
+    cur.execute(f"""
+        INSERT INTO {table} ({col_list})
+        SELECT {col_list} FROM {stage}
+        ON CONFLICT ({conflict_key}) DO UPDATE SET
+            {updates}
+    """)
+    return len(df)
+
+
+def _fix_invalid_geometries(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Return a copy with make_valid applied only to invalid geometries.
+    Cheaper than an unconditional buffer(0) — shapely.is_valid is a vectorized
+    check and typically only a few percent of source polygons need fixing.
+    """
+    gdf = gdf.copy()
+    invalid = ~shapely.is_valid(gdf.geometry.values)
+    if invalid.any():
+        gdf.loc[invalid, "geometry"] = shapely.make_valid(gdf.geometry.values[invalid])
+    return gdf
+
+
+def _contains_lower(values: pd.Series, pattern: str) -> pd.Series:
+    """
+    Same as values.astype(str).str.lower().str.contains(pattern) for the
+    patterns used here, but the column is factorized as-is (no full-length
+    string copy) and only the distinct values are stringified, lowercased and
+    regex-matched; hits are broadcast back through the codes. Missing values
+    (code -1) never match. Category / type columns have a handful of distinct
+    values over many rows.
+    """
+    codes, uniques = pd.factorize(values)
+    hits = pd.Index(uniques).astype(str).str.lower().str.contains(pattern, regex=True)
+    # trailing False catches code -1 (missing)
+    hits = np.append(np.asarray(hits, dtype=bool), False)
+    return pd.Series(hits[codes], index=values.index)
+
+
+def _read_vector(
+    path: Path, wanted: list[str], tiles: gpd.GeoDataFrame, margin_m: float = 0.0
+) -> gpd.GeoDataFrame:
+    """
+    Read a vector source via pyogrio, keeping only the attribute columns in
+    `wanted` (case-insensitive) and only features whose envelope intersects
+    the tile extent grown by margin_m — both filters run inside OGR.
+    """
+    wanted_lower = {c.lower() for c in wanted}
+    columns = [f for f in pyogrio.read_info(path)["fields"] if f.lower() in wanted_lower]
+    xmin, ymin, xmax, ymax = tiles.total_bounds
+    extent = gpd.GeoSeries(
+        [shapely.box(xmin - margin_m, ymin - margin_m, xmax + margin_m, ymax + margin_m)],
+        crs=tiles.crs,
+    )
+    return gpd.read_file(path, engine="pyogrio", columns=columns, bbox=extent)
 
 
 def _find_col(gdf: gpd.GeoDataFrame, candidates: list[str]) -> str | None:
@@ -99,7 +204,33 @@ def _find_col(gdf: gpd.GeoDataFrame, candidates: list[str]) -> str | None:
 
 
 def load_tiles(engine: sqlalchemy.Engine) -> gpd.GeoDataFrame:
-    """Load tiles from DB in EPSG:2157 for spatial overlay operations."""
+    """
+    Load tiles from DB in EPSG:2157 for spatial overlay operations.
+
+    The projected frame is pickled to CACHE_DIR, keyed by (count, min, max)
+    of tile_id. generate_grid.py TRUNCATEs without RESTART IDENTITY, so any
+    grid regeneration changes the key and forces a reload.
+
+    ITM centroid coordinates are attached as float64 columns cx_itm / cy_itm
+    so distance code can index plain arrays instead of shapely Points.
+    tile_id is narrowed to int32 (the column is a SERIAL INTEGER) so every
+    per-tile frame derived from it carries half-width join keys.
+    """
+    with engine.connect() as conn:
+        sig = tuple(conn.execute(
+            text("SELECT count(*), min(tile_id), max(tile_id) FROM tiles")
+        ).one())
+
+    cache_path = CACHE_DIR / "planning_tiles_itm_v3.pkl"
+    if cache_path.exists():
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+            if cached["sig"] == sig:
+                log.info("(tiles loaded from cache)")
+                return cached["tiles"]
+        except Exception as e:
+            log.warning("ignoring unreadable tiles cache (%s)", e)
+
     tiles = gpd.read_postgis(
         "SELECT tile_id, geom, centroid FROM tiles",
         engine,
@@ -107,7 +238,54 @@ def load_tiles(engine: sqlalchemy.Engine) -> gpd.GeoDataFrame:
         crs="EPSG:4326",
     )
     tiles = tiles.rename_geometry("geometry")
-    return tiles.to_crs(GRID_CRS_ITM)
+    tiles = tiles.to_crs(GRID_CRS_ITM)
+    tiles["tile_id"] = tiles["tile_id"].astype(np.int32)
+    tiles["cx_itm"], tiles["cy_itm"] = _centroid_xy(tiles).T
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps({"sig": sig, "tiles": tiles}, protocol=5))
+    except OSError as e:
+        log.warning("could not write tiles cache (%s)", e)
+
+    return tiles
+
+
+def load_small_areas(path: Path) -> gpd.GeoDataFrame:
+    """
+    Load CSO Small Areas in EPSG:2157 with valid geometry and _sa_area (m²).
+
+    The prepared frame is written to CACHE_DIR as GeoParquet, keyed by the
+    source file's size and mtime, so reruns skip the reprojection,
+    validity repair and per-polygon area calls entirely.
+    """
+    st = path.stat()
+    cache_path = CACHE_DIR / f"{path.stem}_itm_{st.st_size}_{st.st_mtime_ns}.parquet"
+    if cache_path.exists():
+        try:
+            cso_pop = gpd.read_parquet(cache_path)
+            log.info("(small areas loaded from cache)")
+            return cso_pop
+        except Exception as e:
+            log.warning("ignoring unreadable small-area cache (%s)", e)
+
+    cso_pop = gpd.read_file(str(path))
+    if cso_pop.crs is None or cso_pop.crs.to_epsg() != 2157:
+        cso_pop = cso_pop.to_crs(GRID_CRS_ITM)
+    if cso_pop.geometry.name != "geometry":
+        cso_pop = cso_pop.rename_geometry("geometry")
+    cso_pop = _fix_invalid_geometries(cso_pop)
+    cso_pop["_sa_area"] = cso_pop.geometry.area  # m²
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob(f"{path.stem}_itm_*.parquet"):
+            stale.unlink()
+        cso_pop.to_parquet(cache_path)
+    except OSError as e:
+        log.warning("could not write small-area cache (%s)", e)
+
+    return cso_pop
 
 
 def compute_zoning_overlay(
@@ -129,52 +307,54 @@ def compute_zoning_overlay(
         zoning = zoning.rename_geometry("geometry")
 
     # Fix invalid geometries
-    zoning = zoning.copy()
-    zoning["geometry"] = zoning.geometry.buffer(0)
+    zoning = _fix_invalid_geometries(zoning)
 
     # Detect category column
     cat_col = _find_col(zoning, ["CATEGORY", "GZT_CODE", "ZONE_TYPE", "ZONING",
                                    "zone_type", "category", "LandUseZoning"])
     if cat_col is None:
-        print("  WARNING: No zoning category column found. Using 'Other' for all.")
+        log.warning("No zoning category column found. Using 'Other' for all.")
         zoning["_category"] = "other"
     else:
-        # Map zoning codes to our categories
-        def _map_category(val):
-            if pd.isna(val):
-                return "other"
-            s = str(val).strip()
-            if s in ZONING_MAP:
-                return ZONING_MAP[s]
-            # Check if the value contains a known keyword
-            sl = s.lower()
-            if "industrial" in sl:
-                return "industrial"
-            if "enterprise" in sl:
-                return "enterprise"
-            if "mixed" in sl:
-                return "mixed_use"
-            if "agri" in sl:
-                return "agricultural"
-            if "resid" in sl:
-                return "residential"
-            return "other"
-
-        zoning["_category"] = zoning[cat_col].apply(_map_category)
-
-    print(f"  Zoning category distribution: {dict(zoning['_category'].value_counts())}")
-
-    # Spatial overlay — intersection to compute area-weighted percentages
-    print("  Computing spatial overlay (tiles × zoning)...")
+        # Map zoning codes to our categories — exact lookup first, then
+        # keyword fallback on the unmapped remainder (vectorized str kernels)
+        raw = zoning[cat_col]
+        codes = raw.astype(str).str.strip()
+        category = codes.map(ZONING_MAP)
+        unmapped = category.isna() & raw.notna()
+        if unmapped.any():
+            lowered = codes[unmapped].str.lower()
+            category[unmapped] = np.select(
+                [lowered.str.contains(kw, regex=False) for kw, _ in ZONING_KEYWORDS],
+                [cat for _, cat in ZONING_KEYWORDS],
+                default="other",
+            )
+        zoning["_category"] = category.fillna("other")
+
+    log.info("Zoning category distribution: %s", dict(zoning['_category'].value_counts()))
+
+    # Spatial overlay — bulk STRtree query + vectorized intersection/area,
+    # all in C (no gpd.overlay per-row pandas indexing)
+    log.info("Computing spatial overlay (tiles × zoning)...")
     try:
-        overlay = gpd.overlay(
-            tiles[["tile_id", "geometry"]],
-            zoning[["_category", "geometry"]],
-            how="intersection",
-            keep_geom_type=False,
-        )
+        # Prepare each zoning polygon once (in place); the gathered zone_geoms
+        # below reference the same objects, so every covers() test reuses it
+        shapely.prepare(zoning.geometry.values)
+        tree = STRtree(zoning.geometry.values)
+        tile_idx, zone_idx = tree.query(tiles.geometry.values, predicate="intersects")
+        tile_geoms = tiles.geometry.values[tile_idx]
+        zone_geoms = zoning.geometry.values[zone_idx]
+
+        # Fast path: a tile fully inside one zoning polygon contributes its own
+        # area — only build intersection geometries for the partial overlaps
+        covered = shapely.covers(zone_geoms, tile_geoms)
+        frag_area = shapely.area(tile_geoms)
+        partial = ~covered
+        frag_area[partial] = shapely.area(shapely.intersection(
+            tile_geoms[partial], zone_geoms[partial],
+        ))
     except Exception as e:
-        print(f"  WARNING: gpd.overlay failed ({e}), falling back to sjoin")
+        log.warning("zoning overlay failed (%s), falling back to sjoin", e)
         # Fallback: simple spatial join (majority category per tile)
         joined = gpd.sjoin(tiles[["tile_id", "geometry"]], zoning[["_category", "geometry"]],
                            how="left", predicate="intersects")
@@ -195,8 +375,13 @@ def compute_zoning_overlay(
         result["zoning_tier"] = _compute_zoning_tier(result)
         return result
 
-    # Compute area of each intersection fragment
-    overlay["_frag_area"] = overlay.geometry.area
+    # One row per intersecting (tile, zoning polygon) fragment
+    overlay = pd.DataFrame({
+        "tile_id": tiles["tile_id"].to_numpy()[tile_idx],
+        "_category": zoning["_category"].to_numpy()[zone_idx],
+        "_frag_area": frag_area,
+    })
+    overlay = overlay[overlay["_frag_area"] > 0]
 
     # Aggregate by tile_id + category
     agg = overlay.groupby(["tile_id", "_category"])["_frag_area"].sum().reset_index()
@@ -258,24 +443,18 @@ def _compute_zoning_tier(df: pd.DataFrame) -> pd.Series:
       elif pct_mixed_use > 30: tier = 50 + (pct_mixed_use / 100) * 20
       elif pct_agricultural > 50: tier = 10 + (pct_agricultural / 100) * 20
     """
-    ie_pct = df["pct_industrial"] + df["pct_enterprise"]
-    tier = pd.Series(10.0, index=df.index)  # default
-
-    # Agricultural > 50%
-    mask_agri = df["pct_agricultural"] > 50
-    tier = np.where(mask_agri, 10 + (df["pct_agricultural"] / 100) * 20, tier)
-
-    # Mixed use > 30%
-    mask_mixed = df["pct_mixed_use"] > 30
-    tier = np.where(mask_mixed, 50 + (df["pct_mixed_use"] / 100) * 20, tier)
-
-    # Industrial + Enterprise > 50% (highest priority non-residential)
-    mask_ie = ie_pct > 50
-    tier = np.where(mask_ie, 80 + (ie_pct / 100) * 20, tier)
-
-    # Residential > 50% always caps at 10
-    mask_res = df["pct_residential"] > 50
-    tier = np.where(mask_res, np.minimum(tier, 10), tier)
+    ie_pct = (df["pct_industrial"] + df["pct_enterprise"]).to_numpy()
+    res = df["pct_residential"].to_numpy()
+    mixed = df["pct_mixed_use"].to_numpy()
+    agri = df["pct_agricultural"].to_numpy()
+
+    # Single pass over the if/elif ladder in priority order. Residential > 50%
+    # caps at 10, and every other branch is >= 10, so it simply yields 10.
+    tier = np.select(
+        [res > 50, ie_pct > 50, mixed > 30, agri > 50],
+        [10.0, 80 + (ie_pct / 100) * 20, 50 + (mixed / 100) * 20, 10 + (agri / 100) * 20],
+        default=10.0,
+    )
 
     return pd.Series(tier, index=df.index).clip(0, 100).round(2)
 
@@ -303,14 +482,12 @@ def compute_planning_applications(
 
     # Identify DC-related applications
     if type_col:
-        dc_mask = applications[type_col].astype(str).str.lower().str.contains(
-            "data.cent|industrial|technolog", regex=True, na=False
-        )
+        dc_mask = _contains_lower(applications[type_col], DC_TYPE_PATTERN)
     else:
         dc_mask = pd.Series(True, index=applications.index)
 
     dc_apps = applications[dc_mask].copy()
-    print(f"  DC/industrial applications: {len(dc_apps)} of {len(applications)} total")
+    log.info("DC/industrial applications: %s of %s total", len(dc_apps), len(applications))
 
     # Direct spatial join: applications within tiles
     joined = gpd.sjoin(
@@ -320,45 +497,50 @@ def compute_planning_applications(
         predicate="contains",
     )
 
-    # Build per-tile application lists
-    app_lists = defaultdict(list)
-    for _, row in joined.dropna(subset=["_app_idx"]).iterrows():
-        idx = int(row["_app_idx"])
-        app_row = applications.iloc[idx]
-        app_lists[row["tile_id"]].append({
-            "tile_id": int(row["tile_id"]),
-            "app_ref": str(app_row[ref_col]) if ref_col else f"APP-{idx}",
-            "name": str(app_row[name_col]) if name_col else None,
-            "status": str(app_row[status_col]).lower() if status_col else "other",
-            "app_date": str(app_row[date_col]) if date_col else None,
-            "app_type": str(app_row[type_col]) if type_col else None,
-        })
-
-    # Planning precedent: tiles within 10 km of any DC application
-    print("  Computing planning precedent (10 km buffer)...")
-    buffered = tiles[["tile_id", "geometry"]].copy()
-    buffered["geometry"] = tiles.geometry.buffer(10_000)  # 10 km in EPSG:2157
+    # Build per-tile application lists — stringify each source column once,
+    # then gather by the join's positional indices (no per-row iloc)
+    joined = joined.dropna(subset=["_app_idx"])
+    app_idx = joined["_app_idx"].astype(int).to_numpy()
 
-    if len(dc_apps) > 0:
-        has_dc_nearby = gpd.sjoin(
-            buffered, dc_apps[["geometry"]], how="left", predicate="intersects"
-        )
+    def _gather(col: str | None, lower: bool = False):
+        if col is None:
+            return None
+        vals = applications[col].astype(str)
+        if lower:
+            vals = vals.str.lower()
+        return vals.to_numpy()[app_idx]
+
+    app_records = pd.DataFrame({
+        "tile_id": joined["tile_id"].astype(int).to_numpy(),
+        "app_ref": _gather(ref_col) if ref_col else [f"APP-{i}" for i in app_idx],
+        "name": _gather(name_col),
+        "status": _gather(status_col, lower=True) if status_col else "other",
+        "app_date": _gather(date_col),
+        "app_type": _gather(type_col),
+    })
+    app_lists = {
+        tid: group.to_dict("records")
+        for tid, group in app_records.groupby("tile_id", sort=False)
+    }
 
-        # Score: any DC nearby → +40, granted DC nearby → additional +20
-        dc_nearby_tiles = has_dc_nearby.dropna(subset=["index_right"]).groupby("tile_id")
-        precedent = pd.Series(0.0, index=tiles["tile_id"])
+    # Planning precedent: tiles within 10 km of any DC application.
+    # dwithin on the DC tree — no buffered tile polygons, no sjoin frame.
+    log.info("Computing planning precedent (10 km radius)...")
+    precedent = pd.Series(0.0, index=tiles["tile_id"])
 
-        for tid, group in dc_nearby_tiles:
-            precedent[tid] = 40.0
+    if len(dc_apps) > 0:
+        tree = STRtree(dc_apps.geometry.values)
+        tile_idx, dc_idx = tree.query(tiles.geometry.values, predicate="dwithin", distance=10_000)
 
-            # Check if any granted applications are nearby
-            if status_col:
-                app_indices = group["index_right"].astype(int).values
-                statuses = dc_apps.iloc[app_indices][status_col].astype(str).str.lower()
-                if (statuses == "granted").any():
-                    precedent[tid] = 60.0
-    else:
-        precedent = pd.Series(0.0, index=tiles["tile_id"])
+        # Score: any DC nearby → 40, granted DC nearby → 60
+        if status_col:
+            statuses = dc_apps[status_col].astype(str).str.lower().to_numpy()
+            granted = statuses[dc_idx] == "granted"
+        else:
+            granted = np.zeros(len(dc_idx), dtype=bool)
+
+        granted_per_tile = pd.Series(granted).groupby(tiles["tile_id"].to_numpy()[tile_idx]).any()
+        precedent.loc[granted_per_tile.index] = np.where(granted_per_tile.to_numpy(), 60.0, 40.0)
 
     result = pd.DataFrame({
         "tile_id": tiles["tile_id"],
@@ -388,31 +570,33 @@ def compute_population_density(
     if cso_pop.geometry.name != "geometry":
         cso_pop = cso_pop.rename_geometry("geometry")
 
-    # Fix invalid geometries
-    cso_pop = cso_pop.copy()
-    cso_pop["geometry"] = cso_pop.geometry.buffer(0)
+    # load_small_areas() hands over repaired geometry with _sa_area precomputed
+    if "_sa_area" in cso_pop.columns:
+        cso_pop = cso_pop.copy()
+    else:
+        cso_pop = _fix_invalid_geometries(cso_pop)
+        cso_pop["_sa_area"] = cso_pop.geometry.area  # m²
 
     # Detect population column
     pop_col = _find_col(cso_pop, ["TOTAL_POP", "T1_1AGETT", "POPULATION", "Pop",
                                     "Total_Pop", "total_pop", "PERSONS", "persons"])
     if pop_col is None:
-        print("  WARNING: No population column found. Using 0 for all tiles.")
+        log.warning("No population column found. Using 0 for all tiles.")
         return pd.Series(0.0, index=tiles["tile_id"], name="pop_density")
 
     cso_pop["_pop"] = pd.to_numeric(cso_pop[pop_col], errors="coerce").fillna(0)
-    cso_pop["_sa_area"] = cso_pop.geometry.area  # m²
 
-    # Spatial overlay to compute area-weighted population
-    print("  Computing population overlay (tiles × small areas)...")
+    # Area-weighted population — bulk STRtree query + vectorized intersection
+    # area, then one bincount reduction per tile (no gpd.overlay frame)
+    log.info("Computing population overlay (tiles × small areas)...")
     try:
-        overlay = gpd.overlay(
-            tiles[["tile_id", "geometry"]],
-            cso_pop[["_pop", "_sa_area", "geometry"]],
-            how="intersection",
-            keep_geom_type=False,
-        )
+        tree = STRtree(cso_pop.geometry.values)
+        tile_idx, sa_idx = tree.query(tiles.geometry.values, predicate="intersects")
+        frag_area = shapely.area(shapely.intersection(
+            tiles.geometry.values[tile_idx], cso_pop.geometry.values[sa_idx],
+        ))
     except Exception as e:
-        print(f"  WARNING: overlay failed ({e}), falling back to sjoin")
+        log.warning("overlay failed (%s), falling back to sjoin", e)
         # Fallback: sum population of small areas whose centroids fall in each tile
         cso_centroids = cso_pop.copy()
         cso_centroids["geometry"] = cso_pop.geometry.centroid
@@ -422,61 +606,66 @@ def compute_population_density(
         density = pop_sum / 5.0  # 5 km² tiles
         return density.reindex(tiles["tile_id"]).fillna(0.0).rename("pop_density")
 
-    overlay["_frag_area"] = overlay.geometry.area
     # Weight: fraction of the SA that falls in this tile
-    overlay["_weight"] = overlay["_frag_area"] / overlay["_sa_area"].clip(lower=1)
-    overlay["_weighted_pop"] = overlay["_pop"] * overlay["_weight"]
+    pop = cso_pop["_pop"].to_numpy(dtype=np.float64)
+    sa_area = cso_pop["_sa_area"].to_numpy(dtype=np.float64)
+    weighted_pop = pop[sa_idx] * frag_area / np.maximum(sa_area[sa_idx], 1.0)
 
-    pop_per_tile = overlay.groupby("tile_id")["_weighted_pop"].sum()
+    pop_per_tile = np.bincount(tile_idx, weights=weighted_pop, minlength=len(tiles))
     density = pop_per_tile / 5.0  # 5 km² tiles
 
-    return density.reindex(tiles["tile_id"]).fillna(0.0).rename("pop_density")
+    return pd.Series(density, index=tiles["tile_id"], name="pop_density")
 
 
 def compute_nearest_ida_km(tiles: gpd.GeoDataFrame, engine: sqlalchemy.Engine) -> pd.Series:
     """
     Compute distance from each tile centroid to nearest IDA site.
     Returns Series[tile_id → distance_km]. NaN if no IDA sites exist.
-    """
-    try:
-        ida = gpd.read_postgis(
-            "SELECT ida_site_id, geom FROM ida_sites",
-            engine,
-            geom_col="geom",
-            crs="EPSG:4326",
-        )
-    except Exception:
-        ida = gpd.GeoDataFrame(columns=["ida_site_id", "geom"], geometry="geom")
 
-    if len(ida) == 0:
-        print("  IDA sites table is empty — returning NaN for nearest_ida_site_km")
-        return pd.Series(np.nan, index=tiles["tile_id"], name="nearest_ida_site_km")
-
-    ida = ida.to_crs(GRID_CRS_ITM)
-    if ida.geometry.name != "geometry":
-        ida = ida.rename_geometry("geometry")
+    Both tables already live in PostGIS, so the nearest-neighbour search runs
+    in the database — no geometries cross the wire. Index use: the KNN
+    ORDER BY and the ST_DWithin both compare the stored EPSG:4326 columns, so
+    they walk ida_sites_geom_gist; ST_Transform only appears in ST_Distance.
 
-    # Compute tile centroids in ITM
-    centroids = tiles.copy()
-    centroids["geometry"] = tiles.geometry.centroid
+    Planar degree distance skews east-west vs north-south (1° lng ≈ 0.6° lat
+    here), so the degree-nearest site is only an upper bound: its ITM distance,
+    turned into a degree radius via IDA_MIN_M_PER_DEG, gathers every site that
+    could be nearer, and the minimum ITM distance among those is exact.
+    """
+    sql = text("""
+        SELECT t.tile_id,
+               MIN(ST_Distance(ST_Transform(t.centroid, 2157),
+                               ST_Transform(i.geom, 2157))) / 1000.0 AS km
+        FROM tiles t
+        CROSS JOIN LATERAL (
+            SELECT ST_Distance(ST_Transform(t.centroid, 2157),
+                               ST_Transform(n.geom, 2157)) AS bound_m
+            FROM ida_sites n
+            ORDER BY n.geom <-> t.centroid
+            LIMIT 1
+        ) nn
+        JOIN ida_sites i
+          ON ST_DWithin(i.geom, t.centroid, nn.bound_m / :m_per_deg)
+        GROUP BY t.tile_id
+    """)
+    with engine.connect() as conn:
+        rows = conn.execute(sql, {"m_per_deg": IDA_MIN_M_PER_DEG}).all()
+
+    if len(rows) == 0:
+        log.info("IDA sites table is empty — returning NaN for nearest_ida_site_km")
+        return pd.Series(np.nan, index=tiles["tile_id"], name="nearest_ida_site_km")
 
-    # Nearest join
-    nearest = gpd.sjoin_nearest(
-        centroids[["tile_id", "geometry"]],
-        ida[["geometry"]],
-        how="left",
-        distance_col="dist_m",
+    dist_km = pd.Series(
+        [r[1] for r in rows], index=[r[0] for r in rows], dtype=float,
     )
-
-    # Take minimum distance per tile (in case of multiple matches)
-    min_dist = nearest.groupby("tile_id")["dist_m"].min() / 1000.0  # m → km
-    return min_dist.reindex(tiles["tile_id"]).rename("nearest_ida_site_km")
+    return dist_km.reindex(tiles["tile_id"]).rename("nearest_ida_site_km")
 
 
 def compute_land_pricing(
     tiles: gpd.GeoDataFrame,
     ppr_path: Path,
     settlements_path: Path,
+    engine: sqlalchemy.Engine | None = None,
 ) -> pd.DataFrame:
     """
     Compute per-tile land pricing metrics from Property Price Register transactions.
@@ -488,12 +677,104 @@ def compute_land_pricing(
       4. Spatial join geocoded transactions to tiles
       5. Compute per-tile median price/m² and transaction count
 
+    Steps 1–3 do not depend on the tiles and are cached by _load_geocoded_ppr().
+
     Returns DataFrame with tile_id, avg_price_per_sqm_eur, transaction_count.
     """
+    ppr = _load_geocoded_ppr(ppr_path, settlements_path)
+    if ppr is None:
+        return pd.DataFrame({"tile_id": tiles["tile_id"], "avg_price_per_sqm_eur": np.nan, "transaction_count": 0})
+
+    points = ppr.geometry.to_numpy().copy()
+    ungeocoded = ppr.geometry.isna().to_numpy()
+
+    # Fallback: county centroid for ungeocodable records
+    if ungeocoded.any() and ppr["_county"].notna().any():
+        county_centroids = _get_county_centroids(tiles, engine)
+        points[ungeocoded] = (
+            ppr.loc[ungeocoded, "_county"].str.strip().str.lower().map(county_centroids).to_numpy()
+        )
+        log.info(
+            "After county fallback: %s geocoded transactions total",
+            int(pd.notna(points).sum()),
+        )
+
+    located = pd.notna(points)
+    if not located.any():
+        log.warning("No transactions geocoded. Returning empty land pricing.")
+        return pd.DataFrame({"tile_id": tiles["tile_id"], "avg_price_per_sqm_eur": np.nan, "transaction_count": 0})
+
+    # ── Spatial join to tiles ──────────────────────────────────
+    # Query the tile STRtree directly instead of gpd.sjoin: no GeoDataFrame
+    # for the points and no wide join frame, just (point, tile) index pairs.
+    log.info("Spatial joining transactions to tiles...")
+    tree = STRtree(tiles.geometry.values)
+    pt_idx, tile_idx = tree.query(points[located], predicate="within")
+
+    joined = pd.DataFrame({
+        "tile_id": tiles["tile_id"].to_numpy()[tile_idx],
+        "_price_per_sqm": ppr["_price_per_sqm"].to_numpy(dtype=float)[located][pt_idx],
+    })
+
+    # Aggregate per tile
+    tile_stats = joined.groupby("tile_id").agg(
+        avg_price_per_sqm_eur=("_price_per_sqm", "median"),
+        transaction_count=("_price_per_sqm", "count"),
+    ).reset_index()
+
+    # Merge back to all tiles
+    result = tiles[["tile_id"]].merge(tile_stats, on="tile_id", how="left")
+    result["avg_price_per_sqm_eur"] = result["avg_price_per_sqm_eur"].astype(float)
+    result["transaction_count"] = result["transaction_count"].fillna(0).astype(int)
+
+    # For tiles with no direct transactions, interpolate from neighbours (IDW)
+    has_data = result["avg_price_per_sqm_eur"].notna()
+    missing = ~has_data
+    if missing.any() and has_data.sum() > 10:
+        log.info("Interpolating %s tiles with no direct transactions...", missing.sum())
+        result = _interpolate_missing_prices(result, tiles)
+
+    log.info(
+        "Land pricing: %s tiles with direct data, median €%.0f/m²",
+        has_data.sum(),
+        result['avg_price_per_sqm_eur'].median(),
+    )
+
+    return result
+
+
+def _load_geocoded_ppr(ppr_path: Path, settlements_path: Path) -> gpd.GeoDataFrame | None:
+    """
+    Load, clean and settlement-geocode the PPR CSV.
+
+    Returns one row per kept transaction with _price_per_sqm, _county and an
+    ITM point geometry (None where no settlement matched), or None if the CSV
+    has no price column. The result is cached in CACHE_DIR as GeoParquet,
+    keyed by PPR_CACHE_VERSION and the size and mtime of both input files,
+    with geocoded rows in Hilbert order so the tile join on reload walks the
+    STRtree locally.
+    """
+    key = [PPR_CACHE_VERSION, ppr_path.stat().st_size, ppr_path.stat().st_mtime_ns]
+    if settlements_path.exists():
+        key += [settlements_path.stat().st_size, settlements_path.stat().st_mtime_ns]
+    cache_path = CACHE_DIR / f"ppr_geocoded_{hashlib.sha1(repr(key).encode()).hexdigest()[:16]}.parquet"
+    if cache_path.exists():
+        try:
+            ppr = gpd.read_parquet(cache_path)
+            log.info("(geocoded PPR loaded from cache: %s transactions)", len(ppr))
+            return ppr
+        except Exception as e:
+            log.warning("ignoring unreadable PPR cache (%s)", e)
+
     # ── Load PPR ───────────────────────────────────────────────
-    print("  Loading PPR CSV...")
-    # PPR CSV uses €-prefixed prices and Irish date format
-    ppr = pd.read_csv(ppr_path, encoding="utf-8-sig")
+    log.info("Loading PPR CSV...")
+    # PPR CSV uses €-prefixed prices and Irish date format.
+    # Multi-threaded Arrow reader; Arrow-backed string columns keep the
+    # .str cleanup below on Arrow compute kernels instead of object arrays.
+    ppr = pacsv.read_csv(
+        ppr_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=16 << 20),
+    ).to_pandas(types_mapper=pd.ArrowDtype)
 
     # Normalise column names — PPR headers sometimes have \ufeff BOM or extra spaces
     ppr.columns = ppr.columns.str.strip().str.replace("\ufeff", "")
@@ -505,8 +786,8 @@ def compute_land_pricing(
             price_col = c
             break
     if price_col is None:
-        print("  WARNING: No price column found in PPR. Skipping land pricing.")
-        return pd.DataFrame({"tile_id": tiles["tile_id"], "avg_price_per_sqm_eur": np.nan, "transaction_count": 0})
+        log.warning("No price column found in PPR. Skipping land pricing.")
+        return None
 
     # Clean price: remove € symbol, commas, convert to float
     ppr["_price"] = (
@@ -527,7 +808,7 @@ def compute_land_pricing(
         cutoff = ppr["_date"].max() - pd.DateOffset(years=3)
         before = len(ppr)
         ppr = ppr[ppr["_date"] >= cutoff]
-        print(f"  Filtered to last 3 years: {before} → {len(ppr)} transactions")
+        log.info("Filtered to last 3 years: %s → %s transactions", before, len(ppr))
 
     # Estimate price per m² from Property Size Description
     size_col = _find_col(ppr, ["Property Size Description", "SIZE_DESC", "Property_Size"])
@@ -552,7 +833,12 @@ def compute_land_pricing(
     # Remove extreme outliers (< 1st percentile, > 99th percentile)
     p1, p99 = ppr["_price_per_sqm"].quantile([0.01, 0.99])
     ppr = ppr[(ppr["_price_per_sqm"] >= p1) & (ppr["_price_per_sqm"] <= p99)]
-    print(f"  After outlier removal: {len(ppr)} transactions, price/m² range: €{p1:.0f}–€{p99:.0f}")
+    log.info(
+        "After outlier removal: %s transactions, price/m² range: €%.0f–€%.0f",
+        len(ppr),
+        p1,
+        p99,
+    )
 
     # ── Geocode via OSM settlement matching ────────────────────
     # Detect address column
@@ -560,7 +846,7 @@ def compute_land_pricing(
     county_col = _find_col(ppr, ["County", "COUNTY", "county"])
 
     if settlements_path.exists():
-        print("  Loading OSM settlement points for geocoding...")
+        log.info("Loading OSM settlement points for geocoding...")
         settlements = gpd.read_file(str(settlements_path))
         if settlements.crs is None or settlements.crs.to_epsg() != 2157:
             settlements = settlements.to_crs(GRID_CRS_ITM)
@@ -572,199 +858,214 @@ def compute_land_pricing(
             name_col_s = settlements.columns[0]
 
         # Build lookup: lowercase settlement name → ITM point
-        settlement_lookup: dict[str, object] = {}
-        for _, srow in settlements.iterrows():
-            sname = str(srow[name_col_s]).strip().lower()
-            if sname and sname != "nan":
-                settlement_lookup[sname] = srow.geometry
+        snames = settlements[name_col_s].astype(str).str.strip().str.lower().to_numpy()
+        sgeoms = settlements.geometry.to_numpy()
+        keep = (snames != "") & (snames != "nan")
+        settlement_lookup: dict[str, object] = dict(zip(snames[keep].tolist(), sgeoms[keep].tolist()))
 
-        print(f"  Settlement lookup: {len(settlement_lookup)} entries")
+        log.info("Settlement lookup: %s entries", len(settlement_lookup))
 
-        # Pre-build substring index once (avoids O(n*m) per-row scanning)
-        substring_idx = _build_substring_index(settlement_lookup)
+        # Compile all settlement names into one automaton (single pass per address)
+        automaton = _build_settlement_automaton(settlement_lookup)
 
         # Match PPR addresses to settlements
-        matched_points = []
-        for _, row in ppr.iterrows():
-            addr = str(row[addr_col]) if addr_col else ""
-            pt = _geocode_address(addr, settlement_lookup, substring_idx)
-            matched_points.append(pt)
-
-        ppr["_geom"] = matched_points
-        geocoded = ppr.dropna(subset=["_geom"])
-        print(f"  Geocoded {len(geocoded)} of {len(ppr)} transactions ({len(geocoded)/len(ppr)*100:.0f}%)")
+        if addr_col:
+            addresses = pd.Series(ppr[addr_col].astype(str).to_numpy(), dtype=object)
+        else:
+            addresses = pd.Series("", index=range(len(ppr)), dtype=object)
+
+        geoms = _geocode_addresses(addresses, settlement_lookup, automaton)
+        n_geocoded = int(pd.notna(geoms).sum())
+        log.info(
+            "Geocoded %s of %s transactions (%.0f%%)",
+            n_geocoded,
+            len(ppr),
+            n_geocoded / max(len(ppr), 1) * 100,
+        )
     else:
-        print("  WARNING: OSM settlements file not found — falling back to county centroid geocoding")
-        geocoded = ppr.copy()
-        geocoded["_geom"] = None
-        settlement_lookup = {}
-
-    # Fallback: county centroid for ungeocodable records
-    if county_col and len(geocoded) < len(ppr):
-        county_centroids = _get_county_centroids(tiles)
-        ungeocodable = ppr[ppr.index.isin(geocoded.index) == False].copy()
-        fallback_points = []
-        for _, row in ungeocodable.iterrows():
-            county = str(row[county_col]).strip()
-            pt = county_centroids.get(county.lower())
-            fallback_points.append(pt)
-        ungeocodable["_geom"] = fallback_points
-        ungeocodable = ungeocodable.dropna(subset=["_geom"])
-        geocoded = pd.concat([geocoded, ungeocodable], ignore_index=True)
-        print(f"  After county fallback: {len(geocoded)} geocoded transactions total")
-
-    if len(geocoded) == 0:
-        print("  WARNING: No transactions geocoded. Returning empty land pricing.")
-        return pd.DataFrame({"tile_id": tiles["tile_id"], "avg_price_per_sqm_eur": np.nan, "transaction_count": 0})
-
-    # ── Spatial join to tiles ──────────────────────────────────
-    print("  Spatial joining transactions to tiles...")
-    gdf = gpd.GeoDataFrame(
-        geocoded,
-        geometry=geocoded["_geom"].tolist(),
+        log.warning("OSM settlements file not found — falling back to county centroid geocoding")
+        geoms = np.full(len(ppr), None, dtype=object)
+
+    out = gpd.GeoDataFrame(
+        {
+            "_price_per_sqm": ppr["_price_per_sqm"].to_numpy(dtype=np.float64),
+            "_county": ppr[county_col].astype(str).to_numpy() if county_col else None,
+        },
+        geometry=geoms,
         crs=GRID_CRS_ITM,
     )
 
-    joined = gpd.sjoin(gdf, tiles[["tile_id", "geometry"]], how="inner", predicate="within")
-
-    # Aggregate per tile
-    tile_stats = joined.groupby("tile_id").agg(
-        avg_price_per_sqm_eur=("_price_per_sqm", "median"),
-        transaction_count=("_price_per_sqm", "count"),
-    ).reset_index()
+    # Geocoded rows in Hilbert order, ungeocoded rows after them
+    has_geom = out.geometry.notna().to_numpy()
+    order = np.flatnonzero(has_geom)
+    if len(order) > 0:
+        order = order[np.argsort(out.geometry[has_geom].hilbert_distance().to_numpy(), kind="stable")]
+    out = out.iloc[np.concatenate([order, np.flatnonzero(~has_geom)])].reset_index(drop=True)
 
-    # Merge back to all tiles
-    result = tiles[["tile_id"]].merge(tile_stats, on="tile_id", how="left")
-    result["avg_price_per_sqm_eur"] = result["avg_price_per_sqm_eur"].astype(float)
-    result["transaction_count"] = result["transaction_count"].fillna(0).astype(int)
-
-    # For tiles with no direct transactions, interpolate from neighbours (IDW)
-    has_data = result["avg_price_per_sqm_eur"].notna()
-    missing = ~has_data
-    if missing.any() and has_data.sum() > 10:
-        print(f"  Interpolating {missing.sum()} tiles with no direct transactions...")
-        result = _interpolate_missing_prices(result, tiles)
-
-    print(f"  Land pricing: {has_data.sum()} tiles with direct data, "
-          f"median €{result['avg_price_per_sqm_eur'].median():.0f}/m²")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob("ppr_geocoded_*.parquet"):
+            stale.unlink()
+        out.to_parquet(cache_path, compression="zstd")
+    except OSError as e:
+        log.warning("could not write PPR cache (%s)", e)
 
-    return result
+    return out
 
 
-def _build_substring_index(settlement_lookup: dict) -> dict[str, object]:
+def _build_settlement_automaton(settlement_lookup: dict) -> ahocorasick.Automaton | None:
     """
-    Build a reverse index mapping every 4+ char settlement name to its geometry.
-    Used for fast substring matching without O(n*m) nested loops.
-    Longer names are checked first (most specific match wins).
+    Build an Aho-Corasick automaton over every 4+ char settlement name.
+    Each payload is (len, -insertion_order, name) so max() over the matches
+    picks the longest (most specific) name, ties going to the first inserted.
+    Returns None if no name qualifies (an empty automaton cannot be searched).
     """
-    # Sort by length descending so longer/more-specific names take priority
-    sorted_names = sorted(settlement_lookup.keys(), key=len, reverse=True)
-    return {name: settlement_lookup[name] for name in sorted_names if len(name) >= 4}
+    automaton = ahocorasick.Automaton()
+    for order, name in enumerate(settlement_lookup):
+        if len(name) >= 4:
+            automaton.add_word(name, (len(name), -order, name))
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
 
 
-def _geocode_address(address: str, settlement_lookup: dict,
-                     substring_index: dict | None = None) -> object | None:
+def _geocode_addresses(addresses: pd.Series, settlement_lookup: dict,
+                       automaton: ahocorasick.Automaton | None = None) -> np.ndarray:
     """
-    Match an address string to an OSM settlement point.
-    Extracts town/city/village names from the address and looks up in the settlement dict.
-    Uses pre-built substring_index for fast substring matching.
-    Returns ITM point geometry or None.
+    Match address strings to OSM settlement points.
+    Each address component is looked up against the settlement names, the
+    right-most match winning; unmatched addresses fall back to the settlement
+    automaton for names embedded anywhere in the address.
+    Returns an object array of ITM point geometries (None where unmatched).
     """
-    if not address or address == "nan":
-        return None
+    addresses = addresses.str.lower()
+    result = np.full(len(addresses), None, dtype=object)
+    valid = (addresses.notna() & (addresses != "") & (addresses != "nan")).to_numpy()
+    if not valid.any() or not settlement_lookup:
+        return result
+
+    names = pd.Index(list(settlement_lookup))
+    geoms = np.empty(len(settlement_lookup), dtype=object)
+    geoms[:] = list(settlement_lookup.values())
 
     # PPR addresses are comma-separated: "Unit 5, Main Street, Killarney, Co. Kerry"
-    # Try matching each address component against settlements
-    parts = [p.strip().lower() for p in address.split(",")]
-
-    # Try parts from right to left (more specific → less specific)
-    # Skip the last part if it looks like a county
-    for part in reversed(parts):
-        if part.startswith("co.") or part.startswith("county"):
-            continue
-        # Clean common prefixes
-        cleaned = part.strip()
-        if cleaned in settlement_lookup:
-            return settlement_lookup[cleaned]
-
-    # Try substrings via pre-built index (avoids O(n*m) inner loop)
-    if substring_index is not None:
-        addr_lower = address.lower()
-        for sname, sgeom in substring_index.items():
-            if sname in addr_lower:
-                return sgeom
+    # Split into an (N, K) grid of cleaned components, then one isin per column.
+    # County components ("Co. Kerry", "County Kerry") never count as a match.
+    parts = addresses.str.split(",", expand=True)
+    cells = np.empty(parts.shape, dtype=object)
+    hits = np.zeros(parts.shape, dtype=bool)
+    for k in range(parts.shape[1]):
+        col = parts[k].str.strip()
+        cells[:, k] = col.to_numpy()
+        is_county = col.str.startswith("co.", na=False) | col.str.startswith("county", na=False)
+        hits[:, k] = (col.isin(names) & ~is_county).to_numpy()
+    hits &= valid[:, None]
+
+    # Right-most matching component (more specific → less specific)
+    matched = hits.any(axis=1)
+    last = parts.shape[1] - 1 - np.argmax(hits[:, ::-1], axis=1)
+    rows = np.flatnonzero(matched)
+    result[rows] = geoms[names.get_indexer(cells[rows, last[rows]])]
+
+    # Substring match — one linear automaton pass, longest name wins
+    if automaton is not None:
+        for i in np.flatnonzero(valid & ~matched):
+            best = max((m for _, m in automaton.iter(addresses.iat[i])), default=None)
+            if best is not None:
+                result[i] = settlement_lookup[best[2]]
 
-    return None
+    return result
 
 
-def _get_county_centroids(tiles: gpd.GeoDataFrame) -> dict:
-    """Get approximate county centroids from tile data (in ITM). Returns {county_lower: Point}."""
+def _get_county_centroids(tiles: gpd.GeoDataFrame, engine: sqlalchemy.Engine | None = None) -> dict:
+    """
+    Get approximate county centroids from tile data (in ITM). Returns {county_lower: Point}.
+    Reuses the caller's engine when given; each county's centroid is
+    projected once, not once per coordinate.
+    """
     # tiles has a 'centroid' column in WGS84, but geometry is in ITM
     # Use tile centroids grouped by county
     # Need to join county info — load from DB
     try:
-        from sqlalchemy import create_engine, text as sa_text
-        engine = create_engine(DB_URL)
+        if engine is None:
+            engine = sqlalchemy.create_engine(DB_URL)
         with engine.connect() as conn:
-            rows = conn.execute(sa_text(
-                "SELECT DISTINCT county, ST_X(ST_Transform(ST_Centroid(ST_Collect(geom)), 2157)) AS x, "
-                "ST_Y(ST_Transform(ST_Centroid(ST_Collect(geom)), 2157)) AS y "
-                "FROM tiles GROUP BY county"
+            rows = conn.execute(text(
+                "SELECT county, ST_X(c) AS x, ST_Y(c) AS y FROM ("
+                "  SELECT county, ST_Transform(ST_Centroid(ST_Collect(geom)), 2157) AS c"
+                "  FROM tiles GROUP BY county"
+                ") s"
             ))
-            from shapely.geometry import Point as ShapelyPoint
-            return {r[0].lower(): ShapelyPoint(r[1], r[2]) for r in rows}
+            return {r[0].lower(): shapely.Point(r[1], r[2]) for r in rows}
     except Exception:
         return {}
 
 
+def _centroid_xy(tiles: gpd.GeoDataFrame) -> np.ndarray:
+    """(N, 2) float64 ITM centroid coordinates, from cx_itm/cy_itm when load_tiles set them."""
+    if "cx_itm" in tiles.columns and "cy_itm" in tiles.columns:
+        return tiles[["cx_itm", "cy_itm"]].to_numpy(dtype=np.float64)
+    return shapely.get_coordinates(tiles.geometry.centroid.values)
+
+
 def _interpolate_missing_prices(result: pd.DataFrame, tiles: gpd.GeoDataFrame) -> pd.DataFrame:
     """
     Fill missing tile prices using inverse-distance weighted interpolation
-    from nearby tiles that have data. Simple IDW with k=5 nearest neighbours.
+    from nearby tiles that have data. Simple IDW with k=5 nearest neighbours,
+    all unknown tiles resolved in one cKDTree batch query.
     """
-    from shapely.geometry import Point as ShapelyPoint
-
-    # Get tile centroids in ITM
-    centroids = tiles.set_index("tile_id").geometry.centroid
+    # Tile centroids in ITM, addressed by position in `tiles`
+    xy = _centroid_xy(tiles)
+    pos = pd.Index(tiles["tile_id"]).get_indexer(result["tile_id"])
 
-    has_data = result.set_index("tile_id")
-    known = has_data[has_data["avg_price_per_sqm_eur"].notna()]
-    unknown = has_data[has_data["avg_price_per_sqm_eur"].isna()]
+    prices = result["avg_price_per_sqm_eur"].to_numpy(dtype=np.float64, copy=True)
+    missing = np.isnan(prices)
+    known_mask = ~missing & (pos >= 0)
+    unknown_mask = missing & (pos >= 0)
 
-    if len(known) == 0 or len(unknown) == 0:
+    if not known_mask.any() or not unknown_mask.any():
         return result
 
-    # Build arrays for vectorised distance computation
-    known_xy = np.array([(centroids[tid].x, centroids[tid].y) for tid in known.index if tid in centroids.index])
-    known_prices = known.loc[[tid for tid in known.index if tid in centroids.index], "avg_price_per_sqm_eur"].values
-
-    for tid in unknown.index:
-        if tid not in centroids.index:
-            continue
-        cx, cy = centroids[tid].x, centroids[tid].y
-        dists = np.sqrt((known_xy[:, 0] - cx) ** 2 + (known_xy[:, 1] - cy) ** 2)
-        # k nearest
-        k = min(5, len(dists))
-        nearest_idx = np.argpartition(dists, k)[:k]
-        nearest_dists = dists[nearest_idx]
-        nearest_prices = known_prices[nearest_idx]
-        # IDW weights (avoid division by zero)
-        weights = 1.0 / np.maximum(nearest_dists, 100.0)
-        interpolated = np.average(nearest_prices, weights=weights)
-        result.loc[result["tile_id"] == tid, "avg_price_per_sqm_eur"] = interpolated
+    known = prices[known_mask]
+    known_xy = xy[pos[known_mask]]
+    unknown_xy = xy[pos[unknown_mask]]
+
+    k = min(5, len(known))
+    dists, idxs = cKDTree(known_xy).query(unknown_xy, k=k, workers=-1)
+    if k == 1:
+        dists, idxs = dists[:, None], idxs[:, None]
+
+    # IDW weights (avoid division by zero), built in place over the (U, k)
+    # distance buffer; einsum fuses multiply + row-sum without a U×k temporary
+    weights = np.reciprocal(np.maximum(dists, 100.0, out=dists), out=dists)
+    prices[unknown_mask] = np.einsum("ij,ij->i", known[idxs], weights) / weights.sum(axis=1)
+    result["avg_price_per_sqm_eur"] = prices
 
     return result
 
 
+def _align_to_tiles(values: pd.Series, tile_ids: pd.Series) -> np.ndarray:
+    """
+    values (indexed by tile_id) as an array in tile_ids order. Every per-tile
+    series here is built in load_tiles order, so the usual case is a straight
+    copy; only a differently ordered index pays for the hashed reindex.
+    """
+    if values.index.equals(pd.Index(tile_ids)):
+        return values.to_numpy()
+    return values.reindex(tile_ids).to_numpy()
+
+
 def compose_planning_scores(
     zoning_df: pd.DataFrame,
     planning_df: pd.DataFrame,
     pop_density: pd.Series,
-    ida_km: pd.Series,
+    ida_km: pd.Series | None,
     land_pricing_df: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """
     Compose planning_scores from sub-metrics.
+    ida_km may be None when no IDA sites exist (nearest_ida_site_km left NULL).
 
     Final score formula (capped 0–100):
       base = 0.6 * zoning_tier + 0.4 * land_price_score (if available)
@@ -774,83 +1075,55 @@ def compose_planning_scores(
       clamp to [0, 100]
     """
     result = zoning_df.copy()
+    tile_ids = result["tile_id"]
 
-    # Merge planning precedent
-    result = result.merge(
-        planning_df[["tile_id", "planning_precedent"]],
-        on="tile_id", how="left",
-    )
+    # Attach planning precedent (index-aligned, no merge/factorize of tile_id)
+    precedent = planning_df.set_index("tile_id", verify_integrity=True)["planning_precedent"]
+    result["planning_precedent"] = _align_to_tiles(precedent, tile_ids)
     result["planning_precedent"] = result["planning_precedent"].fillna(0)
 
-    # Merge land pricing if available
+    # Attach land pricing if available
     if land_pricing_df is not None:
-        result = result.merge(
-            land_pricing_df[["tile_id", "avg_price_per_sqm_eur", "transaction_count"]],
-            on="tile_id", how="left",
-        )
+        land = land_pricing_df.set_index("tile_id", verify_integrity=True)
+        result["avg_price_per_sqm_eur"] = _align_to_tiles(land["avg_price_per_sqm_eur"], tile_ids)
+        result["transaction_count"] = _align_to_tiles(land["transaction_count"], tile_ids)
         # Normalise price to 0–100 INVERTED (lower price = higher score)
-        price_vals = result["avg_price_per_sqm_eur"]
-        price_min = price_vals.min()
-        price_max = price_vals.max()
+        price_vals = result["avg_price_per_sqm_eur"].to_numpy(dtype=np.float64)
+        price_min = np.nanmin(price_vals, initial=np.inf)
+        price_max = np.nanmax(price_vals, initial=-np.inf)
         if price_max > price_min:
-            result["land_price_score"] = (
-                100 - (price_vals - price_min) / (price_max - price_min) * 100
-            ).round(0).astype("Int16")
+            lp_score = np.round(100 - (price_vals - price_min) / (price_max - price_min) * 100)
         else:
-            result["land_price_score"] = pd.array([50] * len(result), dtype="Int16")
+            lp_score = np.full(len(result), 50.0)
     else:
         result["avg_price_per_sqm_eur"] = np.nan
         result["transaction_count"] = 0
-        result["land_price_score"] = pd.array([pd.NA] * len(result), dtype="Int16")
+        lp_score = np.full(len(result), np.nan)
+    result["land_price_score"] = pd.array(lp_score, dtype="Int16")  # NaN → NULL
 
-    # Compute final score
-    has_land_price = result["land_price_score"].notna()
-    base_score = result["zoning_tier"].copy()
+    # Compute final score on plain float64 arrays (one pass, no Series round-trips)
+    zoning_tier = result["zoning_tier"].to_numpy(dtype=np.float64)
     # Blend zoning_tier with land_price_score where available
-    base_score = np.where(
-        has_land_price,
-        0.6 * result["zoning_tier"] + 0.4 * result["land_price_score"].fillna(0),
-        result["zoning_tier"],
+    base_score = np.where(np.isnan(lp_score), zoning_tier, 0.6 * zoning_tier + 0.4 * lp_score)
+    score = (
+        base_score
+        + np.where(result["planning_precedent"].to_numpy() > 40, 10.0, 0.0)
+        - np.where(result["pct_residential"].to_numpy() > 0, 20.0, 0.0)
     )
-    score = pd.Series(base_score, index=result.index)
-    score = score + np.where(result["planning_precedent"] > 40, 10, 0)
-    score = score - np.where(result["pct_residential"] > 0, 20, 0)
-    result["score"] = score.clip(0, 100).round(2)
+    result["score"] = np.clip(score, 0, 100).round(2)
 
     # Add population density and IDA distance
-    result["population_density_per_km2"] = pop_density.reindex(result["tile_id"]).values
-    result["nearest_ida_site_km"] = ida_km.reindex(result["tile_id"]).values
+    result["population_density_per_km2"] = _align_to_tiles(pop_density, result["tile_id"])
+    if ida_km is not None:
+        result["nearest_ida_site_km"] = _align_to_tiles(ida_km, result["tile_id"])
+    else:
+        result["nearest_ida_site_km"] = np.nan
 
     return result
 
 
 def upsert_planning_scores(df: pd.DataFrame, engine: sqlalchemy.Engine) -> int:
-    """Upsert planning_scores. ON CONFLICT(tile_id) DO UPDATE. Returns row count."""
-    sql = """
-        INSERT INTO planning_scores (
-            tile_id, score, zoning_tier, planning_precedent,
-            pct_industrial, pct_enterprise, pct_mixed_use,
-            pct_agricultural, pct_residential, pct_other,
-            nearest_ida_site_km, population_density_per_km2,
-            land_price_score, avg_price_per_sqm_eur, transaction_count
-        ) VALUES %s
-        ON CONFLICT (tile_id) DO UPDATE SET
-            score                      = EXCLUDED.score,
-            zoning_tier                = EXCLUDED.zoning_tier,
-            planning_precedent         = EXCLUDED.planning_precedent,
-            pct_industrial             = EXCLUDED.pct_industrial,
-            pct_enterprise             = EXCLUDED.pct_enterprise,
-            pct_mixed_use              = EXCLUDED.pct_mixed_use,
-            pct_agricultural           = EXCLUDED.pct_agricultural,
-            pct_residential            = EXCLUDED.pct_residential,
-            pct_other                  = EXCLUDED.pct_other,
-            nearest_ida_site_km        = EXCLUDED.nearest_ida_site_km,
-            population_density_per_km2 = EXCLUDED.population_density_per_km2,
-            land_price_score           = EXCLUDED.land_price_score,
-            avg_price_per_sqm_eur      = EXCLUDED.avg_price_per_sqm_eur,
-            transaction_count          = EXCLUDED.transaction_count
-    """
-
+    """Upsert planning_scores via COPY + ON CONFLICT(tile_id) DO UPDATE. Returns row count."""
     cols = [
         "tile_id", "score", "zoning_tier", "planning_precedent",
         "pct_industrial", "pct_enterprise", "pct_mixed_use",
@@ -859,14 +1132,15 @@ def upsert_planning_scores(df: pd.DataFrame, engine: sqlalchemy.Engine) -> int:
         "land_price_score", "avg_price_per_sqm_eur", "transaction_count",
     ]
 
-    rows = [tuple(_to_py(row[c]) for c in cols) for _, row in df.iterrows()]
+    out = df[cols].copy()
+    # INTEGER / SMALLINT columns: nullable ints so COPY never sees "3.0"
+    for c in ("tile_id", "land_price_score", "transaction_count"):
+        out[c] = out[c].astype("Int64")
 
     pg_conn = engine.raw_connection()
     try:
         cur = pg_conn.cursor()
-        batch_size = 2000
-        for i in tqdm(range(0, len(rows), batch_size), desc="Upserting planning_scores"):
-            execute_values(cur, sql, rows[i: i + batch_size])
+        n = _bulk_upsert(cur, "planning_scores", out, "tile_id")
         pg_conn.commit()
     except Exception:
         pg_conn.rollback()
@@ -875,7 +1149,7 @@ def upsert_planning_scores(df: pd.DataFrame, engine: sqlalchemy.Engine) -> int:
         cur.close()
         pg_conn.close()
 
-    return len(rows)
+    return n
 
 
 def upsert_planning_applications(planning_df: pd.DataFrame, engine: sqlalchemy.Engine) -> int:
@@ -884,62 +1158,62 @@ def upsert_planning_applications(planning_df: pd.DataFrame, engine: sqlalchemy.E
     (Delete+insert pattern, same as tile_designation_overlaps.)
     Returns total rows inserted.
     """
-    # Explode the 'applications' list column into individual rows
-    app_rows: list[dict] = []
-    for _, row in planning_df.iterrows():
-        for app in (row.get("applications") or []):
-            app_rows.append(app)
+    cols = ["tile_id", "app_ref", "name", "status", "app_date", "app_type"]
 
-    if not app_rows:
-        print("  No planning applications to insert.")
+    # Explode the 'applications' list column into individual rows
+    app_dicts = planning_df["applications"].dropna().explode().dropna().tolist()
+    if not app_dicts:
+        log.info("No planning applications to insert.")
         return 0
 
-    affected_tile_ids = list({r["tile_id"] for r in app_rows})
-    rows_by_tile: dict[int, list] = defaultdict(list)
-    for r in app_rows:
-        rows_by_tile[r["tile_id"]].append(r)
+    # Columnar frame sorted by tile, so each tile batch is one contiguous slice
+    apps = pd.DataFrame(app_dicts).reindex(columns=cols)
+    apps = apps.sort_values("tile_id", kind="stable").astype(object)
+    apps = apps.where(apps.notna(), None)
+    records = list(apps.itertuples(index=False, name=None))
+    tile_col = apps["tile_id"].to_numpy(dtype=np.int64)
+
+    # Group boundaries on the sorted tile column (positional, like
+    # groupby.indices, without re-sorting): row offset where each tile starts
+    starts = np.flatnonzero(np.r_[True, tile_col[1:] != tile_col[:-1]])
+    affected_tile_ids = tile_col[starts]
+    bounds = np.append(starts, len(tile_col))
 
     pg_conn = engine.raw_connection()
     total_inserted = 0
     try:
         cur = pg_conn.cursor()
-        batch_size = 2000
+        batch_size = 10_000  # latency-bound: fewer, larger round-trips
 
         for i in tqdm(
             range(0, len(affected_tile_ids), batch_size),
             desc="Upserting planning applications",
         ):
             batch_ids = affected_tile_ids[i: i + batch_size]
-
-            # Delete existing applications for this batch
-            cur.execute(
-                "DELETE FROM tile_planning_applications WHERE tile_id = ANY(%s)",
-                (batch_ids,),
+            batch_rows = records[bounds[i]:bounds[i + len(batch_ids)]]
+
+            # Delete existing + insert fresh applications in one statement
+            # (writable CTE). The DELETE is bound via mogrify because
+            # execute_values only fills the VALUES placeholder.
+            delete_cte = cur.mogrify(
+                "WITH del AS (DELETE FROM tile_planning_applications "
+                "WHERE tile_id = ANY(%s) RETURNING 1)",
+                (batch_ids.tolist(),),
+            ).decode().replace("%", "%%")
+            execute_values(
+                cur,
+                f"""
+                {delete_cte}
+                INSERT INTO tile_planning_applications
+                    ({", ".join(cols)})
+                VALUES %s
+                """,
+                batch_rows,
+                # One page per batch — a second page would re-run the DELETE
+                # and remove the rows the first page just inserted
+                page_size=len(batch_rows),
             )
-
-            # Insert fresh applications
-            batch_rows = [r for tid in batch_ids for r in rows_by_tile.get(tid, [])]
-            if batch_rows:
-                execute_values(
-                    cur,
-                    """
-                    INSERT INTO tile_planning_applications
-                        (tile_id, app_ref, name, status, app_date, app_type)
-                    VALUES %s
-                    """,
-                    [
-                        (
-                            r["tile_id"],
-                            r["app_ref"],
-                            r.get("name"),
-                            r["status"],
-                            r.get("app_date"),
-                            r.get("app_type"),
-                        )
-                        for r in batch_rows
-                    ],
-                )
-                total_inserted += len(batch_rows)
+            total_inserted += len(batch_rows)
 
         pg_conn.commit()
     except Exception:
@@ -975,9 +1249,7 @@ def upsert_pins_planning(
     cat_col = _find_col(zoning, ["CATEGORY", "GZT_CODE", "ZONE_TYPE", "ZONING",
                                    "_category", "category"])
     if cat_col:
-        ie_mask = zoning[cat_col].astype(str).str.lower().str.contains(
-            "industrial|enterprise|i1|i2|e1|e2", regex=True, na=False
-        )
+        ie_mask = _contains_lower(zoning[cat_col], "industrial|enterprise|i1|i2|e1|e2")
         ie_parcels = zoning[ie_mask].copy()
     else:
         ie_parcels = gpd.GeoDataFrame()
@@ -985,32 +1257,37 @@ def upsert_pins_planning(
     if len(ie_parcels) > 0:
         # Cluster by dissolving parcels within 500m of each other,
         # then take representative points, limited to ~500 pins
-        ie_wgs = ie_parcels.to_crs("EPSG:4326")
-
         # Cluster parcels within 2km using STRtree (avoids O(n^2) distance loop)
-        from shapely.strtree import STRtree as _STRtree
         ie_itm = ie_parcels.copy()
         cluster_dist = 2000  # 2 km minimum spacing
 
-        # Pre-compute all centroids
-        parcel_centroids = []
-        for _, row in ie_itm.iterrows():
-            geom = row.geometry
-            if geom.geom_type in ("Polygon", "MultiPolygon"):
-                parcel_centroids.append(geom.representative_point())
-            else:
-                parcel_centroids.append(geom.centroid)
+        # Pre-compute all centroids (representative point for polygons)
+        geoms = ie_itm.geometry.values
+        is_poly = np.isin(shapely.get_type_id(geoms), [3, 6])  # Polygon, MultiPolygon
+        parcel_centroids = np.where(
+            is_poly, shapely.point_on_surface(geoms), shapely.centroid(geoms)
+        )
 
         if len(parcel_centroids) > 0:
-            tree = _STRtree(parcel_centroids)
+            # All neighbour pairs in one bulk dwithin query, grouped CSR-style
+            # by source parcel; the greedy cover then only slices arrays
+            tree = STRtree(parcel_centroids)
+            src, nbr = tree.query(parcel_centroids, predicate="dwithin", distance=cluster_dist)
+            order = np.argsort(src, kind="stable")
+            src, nbr = src[order], nbr[order]
+            offsets = np.searchsorted(src, np.arange(len(parcel_centroids) + 1))
+
             consumed = np.zeros(len(parcel_centroids), dtype=bool)
             selected_indices = []
 
-            for idx in range(len(parcel_centroids)):
+            # Largest parcels first, so the 500-pin cap keeps the most
+            # significant sites rather than whatever comes first in the file
+            visit_order = np.argsort(-shapely.area(geoms), kind="stable")
+
+            for idx in visit_order:
                 if consumed[idx]:
                     continue
-                neighbours = tree.query(parcel_centroids[idx].buffer(cluster_dist))
-                consumed[neighbours] = True
+                consumed[nbr[offsets[idx]:offsets[idx + 1]]] = True
                 selected_indices.append(idx)
                 if len(selected_indices) >= 500:
                     break
@@ -1019,13 +1296,14 @@ def upsert_pins_planning(
             selected_pts = [parcel_centroids[i] for i in selected_indices]
             if selected_pts:
                 wgs_pts = gpd.GeoSeries(selected_pts, crs=GRID_CRS_ITM).to_crs("EPSG:4326")
-                for j, idx in enumerate(selected_indices):
-                    row = ie_itm.iloc[idx]
-                    centroid_wgs = wgs_pts.iloc[j]
-                    cat_val = str(row[cat_col]) if cat_col else "Industrial/Enterprise"
+                if cat_col:
+                    cat_vals = ie_itm[cat_col].iloc[selected_indices].astype(str).to_numpy()
+                else:
+                    cat_vals = np.full(len(selected_indices), "Industrial/Enterprise", dtype=object)
+                for x, y, cat_val in zip(wgs_pts.x.to_numpy(), wgs_pts.y.to_numpy(), cat_vals):
                     pin_rows.append({
-                        "lng": float(centroid_wgs.x),
-                        "lat": float(centroid_wgs.y),
+                        "lng": float(x),
+                        "lat": float(y),
                         "name": f"{cat_val} Zoned Parcel",
                         "type": "zoning_parcel",
                         "app_ref": None,
@@ -1034,101 +1312,117 @@ def upsert_pins_planning(
                         "app_type": None,
                     })
 
-        print(f"  Zoning parcel pins: {len(ie_parcels)} parcels → {len(pin_rows)} after clustering")
+        log.info(
+            "Zoning parcel pins: %s parcels → %s after clustering",
+            len(ie_parcels),
+            len(pin_rows),
+        )
     else:
-        print("  No Industrial/Enterprise parcels found for zoning pins")
+        log.info("No Industrial/Enterprise parcels found for zoning pins")
 
     # ── Planning application pins ────────────────────────────────────────────
     if len(applications) > 0:
-        if applications.crs is None or applications.crs.to_epsg() != 4326:
-            apps_wgs = applications.to_crs("EPSG:4326")
-        else:
-            apps_wgs = applications
+        # Stay in ITM (main() already projected once) and only reproject the
+        # final pin points to WGS84, not every application polygon
+        if applications.crs is None or applications.crs.to_epsg() != 2157:
+            applications = applications.to_crs(GRID_CRS_ITM)
 
-        ref_col = _find_col(apps_wgs, ["APP_REF", "app_ref", "PlanRef", "REF"])
-        status_col = _find_col(apps_wgs, ["STATUS", "status", "Decision"])
-        date_col = _find_col(apps_wgs, ["APP_DATE", "app_date", "DecDate"])
-        type_col = _find_col(apps_wgs, ["APP_TYPE", "app_type", "DevType"])
-        name_col = _find_col(apps_wgs, ["NAME", "name", "Name", "DESCRIPTION"])
+        ref_col = _find_col(applications, ["APP_REF", "app_ref", "PlanRef", "REF"])
+        status_col = _find_col(applications, ["STATUS", "status", "Decision"])
+        date_col = _find_col(applications, ["APP_DATE", "app_date", "DecDate"])
+        type_col = _find_col(applications, ["APP_TYPE", "app_type", "DevType"])
+        name_col = _find_col(applications, ["NAME", "name", "Name", "DESCRIPTION"])
 
         # Filter to DC/industrial types
         if type_col:
-            dc_mask = apps_wgs[type_col].astype(str).str.lower().str.contains(
-                "data.cent|industrial|technolog", regex=True, na=False
-            )
-            dc_apps = apps_wgs[dc_mask]
+            dc_mask = _contains_lower(applications[type_col], DC_TYPE_PATTERN)
+            dc_apps = applications[dc_mask]
         else:
-            dc_apps = apps_wgs
-
-        for _, row in dc_apps.iterrows():
-            geom = row.geometry
-            if geom.geom_type in ("Polygon", "MultiPolygon"):
-                pt = geom.representative_point()
-            elif geom.geom_type == "Point":
-                pt = geom
-            else:
-                pt = geom.centroid
-
-            app_name = str(row[name_col]) if name_col and pd.notna(row.get(name_col)) else "Planning Application"
-            if app_name == "nan":
-                app_name = "Planning Application"
-
-            pin_rows.append({
-                "lng": float(pt.x),
-                "lat": float(pt.y),
-                "name": app_name,
+            dc_apps = applications
+
+        # Pin point per application: representative point for polygons, the
+        # point itself for points, centroid otherwise — all as bulk GEOS calls
+        geoms = dc_apps.geometry.values
+        type_ids = shapely.get_type_id(geoms)
+        app_pts = np.where(
+            np.isin(type_ids, [3, 6]),  # Polygon, MultiPolygon
+            shapely.point_on_surface(geoms),
+            np.where(type_ids == 0, geoms, shapely.centroid(geoms)),
+        )
+
+        # Batch convert pin points to WGS84
+        wgs_app_pts = gpd.GeoSeries(app_pts, crs=GRID_CRS_ITM).to_crs("EPSG:4326")
+        xs = wgs_app_pts.x.to_numpy(dtype=float)
+        ys = wgs_app_pts.y.to_numpy(dtype=float)
+
+        def _col_str(col: str | None, lower: bool = False) -> np.ndarray:
+            """Column as str (None where missing), stringified once for all rows."""
+            if col is None:
+                return np.full(len(dc_apps), None, dtype=object)
+            strs = dc_apps[col].astype(str)
+            if lower:
+                strs = strs.str.lower()
+            return np.where(dc_apps[col].notna().to_numpy(), strs.to_numpy(), None)
+
+        names = _col_str(name_col)
+        names = np.where(pd.isna(names) | (names == "nan"), "Planning Application", names)
+
+        pin_rows.extend(
+            {
+                "lng": float(x),
+                "lat": float(y),
+                "name": name,
                 "type": "planning_application",
-                "app_ref": str(row[ref_col]) if ref_col and pd.notna(row.get(ref_col)) else None,
-                "app_status": str(row[status_col]).lower() if status_col and pd.notna(row.get(status_col)) else None,
-                "app_date": str(row[date_col]) if date_col and pd.notna(row.get(date_col)) else None,
-                "app_type": str(row[type_col]) if type_col and pd.notna(row.get(type_col)) else None,
-            })
+                "app_ref": ref,
+                "app_status": status,
+                "app_date": date,
+                "app_type": app_type,
+            }
+            for x, y, name, ref, status, date, app_type in zip(
+                xs, ys, names, _col_str(ref_col), _col_str(status_col, lower=True),
+                _col_str(date_col), _col_str(type_col),
+            )
+        )
 
-        print(f"  Planning application pins: {len(dc_apps)}")
+        log.info("Planning application pins: %s", len(dc_apps))
     else:
-        print("  No planning applications for pins")
+        log.info("No planning applications for pins")
 
     if not pin_rows:
-        print("  No planning pins to insert.")
+        log.info("No planning pins to insert.")
         return 0
 
-    # Delete existing and re-insert (idempotent)
-    with engine.begin() as conn:
-        conn.execute(text("DELETE FROM pins_planning"))
-
+    # Delete existing and re-insert (idempotent) — one connection, one
+    # transaction, so readers never see an empty pins table in between
     pg_conn = engine.raw_connection()
     try:
         cur = pg_conn.cursor()
-        execute_values(
-            cur,
-            """
-            INSERT INTO pins_planning (geom, name, type, app_ref, app_status, app_date, app_type)
-            VALUES %s
-            """,
-            [
-                (
-                    f"SRID=4326;POINT({r['lng']} {r['lat']})",
-                    r["name"],
-                    r["type"],
-                    r["app_ref"],
-                    r["app_status"],
-                    r["app_date"],
-                    r["app_type"],
-                )
-                for r in pin_rows
-            ],
-            template="(ST_GeomFromEWKT(%s), %s, %s, %s, %s, %s::date, %s)",
+        cur.execute("DELETE FROM pins_planning")
+
+        # COPY with the geometry as hex EWKB (SRID 4326) built client-side:
+        # PostGIS reads it straight into geom, no per-pin WKT parse.
+        # NULL marker is \N so empty-string names stay non-null.
+        pins = pd.DataFrame(pin_rows)
+        pts = shapely.set_srid(shapely.points(pins["lng"].to_numpy(), pins["lat"].to_numpy()), 4326)
+        pins["geom"] = shapely.to_wkb(pts, hex=True, include_srid=True)
+        cols = ["geom", "name", "type", "app_ref", "app_status", "app_date", "app_type"]
+
+        buf = io.StringIO()
+        pins[cols].to_csv(buf, index=False, header=False, na_rep="\\N")
+        buf.seek(0)
+        cur.copy_expert(
+            f"COPY pins_planning ({', '.join(cols)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buf,
         )
 
-        # Assign tile_id via ST_Within
+        # Assign tile_id with one join against the tiles GiST index
+        # (not a correlated subquery per pin)
         cur.execute("""
             UPDATE pins_planning p
-            SET tile_id = (
-                SELECT t.tile_id FROM tiles t
-                WHERE ST_Within(p.geom, t.geom)
-                LIMIT 1
-            )
-            WHERE tile_id IS NULL
+            SET tile_id = t.tile_id
+            FROM tiles t
+            WHERE p.tile_id IS NULL
+              AND ST_Contains(t.geom, p.geom)
         """)
         pg_conn.commit()
     except Exception:
@@ -1141,15 +1435,23 @@ def upsert_pins_planning(
     return len(pin_rows)
 
 
+def _nan_min_max(values: pd.Series) -> tuple[float, float] | None:
+    """(min, max) over the non-null values as one float64 array pass; None if all null."""
+    arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    arr = arr[~np.isnan(arr)]
+    if arr.size == 0:
+        return None
+    return float(arr.min()), float(arr.max())
+
+
 def write_land_price_metric_ranges(scores_df: pd.DataFrame, engine: sqlalchemy.Engine) -> None:
     """Write min/max for avg_price_per_sqm_eur to metric_ranges for Martin normalisation."""
-    price_vals = scores_df["avg_price_per_sqm_eur"].dropna()
-    if len(price_vals) == 0:
-        print("  No land price data — skipping metric_ranges write")
+    value_range = _nan_min_max(scores_df["avg_price_per_sqm_eur"])
+    if value_range is None:
+        log.info("No land price data — skipping metric_ranges write")
         return
 
-    min_val = float(price_vals.min())
-    max_val = float(price_vals.max())
+    min_val, max_val = value_range
 
     with engine.begin() as conn:
         conn.execute(
@@ -1165,19 +1467,18 @@ def write_land_price_metric_ranges(scores_df: pd.DataFrame, engine: sqlalchemy.E
             {"sort": "planning", "metric": "avg_price_per_sqm_eur",
              "min_val": min_val, "max_val": max_val, "unit": "€/m²"},
         )
-    print(f"  Metric range written: avg_price_per_sqm_eur [{min_val:.0f}–{max_val:.0f} €/m²]")
+    log.info("Metric range written: avg_price_per_sqm_eur [%.0f–%.0f €/m²]", min_val, max_val)
 
 
 def write_population_density_metric_ranges(scores_df: pd.DataFrame, engine: sqlalchemy.Engine) -> None:
     """Write min/max for population_density to metric_ranges.
     Keyed as (overall, population_density) to match the tile_heatmap CASE branch."""
-    pop_vals = scores_df["population_density_per_km2"].dropna()
-    if len(pop_vals) == 0:
-        print("  No population density data — skipping metric_ranges write")
+    value_range = _nan_min_max(scores_df["population_density_per_km2"])
+    if value_range is None:
+        log.info("No population density data — skipping metric_ranges write")
         return
 
-    min_val = float(pop_vals.min())
-    max_val = float(pop_vals.max())
+    min_val, max_val = value_range
 
     with engine.begin() as conn:
         conn.execute(
@@ -1193,7 +1494,7 @@ def write_population_density_metric_ranges(scores_df: pd.DataFrame, engine: sqla
             {"sort": "overall", "metric": "population_density",
              "min_val": min_val, "max_val": max_val, "unit": "/km²"},
         )
-    print(f"  Metric range written: population_density [{min_val:.1f}–{max_val:.1f} /km²]")
+    log.info("Metric range written: population_density [%.1f–%.1f /km²]", min_val, max_val)
 
 
 def main():
@@ -1212,114 +1513,151 @@ def main():
     Run AFTER: grid/generate_grid.py
     Run BEFORE: overall/compute_composite.py
     """
-    print("=" * 60)
-    print("Starting planning ingest...")
-    print("=" * 60)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    log.info("=" * 60)
+    log.info("Starting planning ingest...")
+    log.info("=" * 60)
 
     # ── Check source files exist ───────────────────────────────────────────
     required = [MYPLAN_ZONING_FILE, PLANNING_APPLICATIONS_FILE, CSO_POPULATION_FILE]
     missing = [p for p in required if not p.exists()]
     if missing:
         for p in missing:
-            print(f"  ERROR: missing source file: {p}")
-        print("\nRun first: python planning/download_sources.py")
-        print("See ireland-data-sources.md §5, §9 for manual download instructions.")
+            log.error("missing source file: %s", p)
+        log.info("Run first: python planning/download_sources.py")
+        log.info("See ireland-data-sources.md §5, §9 for manual download instructions.")
         raise SystemExit(1)
 
     has_ppr = PPR_FILE.exists()
     if not has_ppr:
-        print(f"  WARNING: PPR file not found at {PPR_FILE}")
-        print("  Land pricing will be skipped. Download from propertypriceregister.ie")
+        log.warning("PPR file not found at %s", PPR_FILE)
+        log.info("Land pricing will be skipped. Download from propertypriceregister.ie")
 
     engine = sqlalchemy.create_engine(DB_URL)
 
     # ── Step 1: Load tiles ─────────────────────────────────────────────────
-    print("\n[1/11] Loading tiles from database...")
+    log.info("[1/11] Loading tiles from database...")
     tiles = load_tiles(engine)
-    print(f"  Loaded {len(tiles)} tiles")
+    log.info("Loaded %s tiles", len(tiles))
 
     # ── Step 2: Load and overlay zoning ────────────────────────────────────
-    print("\n[2/11] Loading MyPlan GZT zoning data...")
-    zoning = gpd.read_file(str(MYPLAN_ZONING_FILE))
-    print(f"  Loaded {len(zoning)} zoning polygons")
+    log.info("[2/11] Loading MyPlan GZT zoning data...")
+    zoning = _read_vector(MYPLAN_ZONING_FILE, ZONING_READ_COLS, tiles)
+    log.info("Loaded %s zoning polygons", len(zoning))
+    # Project once — reused by the overlay and the pin upsert
+    if zoning.crs is None or zoning.crs.to_epsg() != 2157:
+        zoning = zoning.to_crs(GRID_CRS_ITM)
 
-    print("\n[3/11] Computing zoning overlay...")
+    log.info("[3/11] Computing zoning overlay...")
     zoning_df = compute_zoning_overlay(tiles, zoning)
-    print(f"  Zoning tier: min={zoning_df['zoning_tier'].min():.1f}, "
-          f"max={zoning_df['zoning_tier'].max():.1f}, mean={zoning_df['zoning_tier'].mean():.1f}")
-    print(f"  Avg pct_industrial={zoning_df['pct_industrial'].mean():.1f}, "
-          f"pct_residential={zoning_df['pct_residential'].mean():.1f}")
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Zoning tier: min=%.1f, max=%.1f, mean=%.1f",
+            zoning_df['zoning_tier'].min(),
+            zoning_df['zoning_tier'].max(),
+            zoning_df['zoning_tier'].mean(),
+        )
+        log.info(
+            "Avg pct_industrial=%.1f, pct_residential=%.1f",
+            zoning_df['pct_industrial'].mean(),
+            zoning_df['pct_residential'].mean(),
+        )
 
     # ── Step 3: Planning applications ──────────────────────────────────────
-    print("\n[4/11] Loading planning applications...")
-    applications = gpd.read_file(str(PLANNING_APPLICATIONS_FILE))
-    print(f"  Loaded {len(applications)} planning applications")
+    log.info("[4/11] Loading planning applications...")
+    # 10 km margin: applications just outside the grid still count for precedent
+    applications = _read_vector(PLANNING_APPLICATIONS_FILE, APPLICATION_READ_COLS, tiles,
+                                margin_m=10_000)
+    log.info("Loaded %s planning applications", len(applications))
+    if applications.crs is None or applications.crs.to_epsg() != 2157:
+        applications = applications.to_crs(GRID_CRS_ITM)
 
-    print("\n[5/11] Computing planning applications overlay...")
+    log.info("[5/11] Computing planning applications overlay...")
     planning_df = compute_planning_applications(tiles, applications)
-    print(f"  Planning precedent: min={planning_df['planning_precedent'].min():.1f}, "
-          f"max={planning_df['planning_precedent'].max():.1f}, "
-          f"tiles with precedent: {(planning_df['planning_precedent'] > 0).sum()}")
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Planning precedent: min=%.1f, max=%.1f, tiles with precedent: %s",
+            planning_df['planning_precedent'].min(),
+            planning_df['planning_precedent'].max(),
+            (planning_df['planning_precedent'] > 0).sum(),
+        )
 
     # ── Step 4: Population density ─────────────────────────────────────────
-    print("\n[6/11] Loading CSO population data...")
-    cso_pop = gpd.read_file(str(CSO_POPULATION_FILE))
-    print(f"  Loaded {len(cso_pop)} small areas")
+    log.info("[6/11] Loading CSO population data...")
+    cso_pop = load_small_areas(CSO_POPULATION_FILE)
+    log.info("Loaded %s small areas", len(cso_pop))
 
-    print("\n[7/11] Computing population density...")
+    log.info("[7/11] Computing population density...")
     pop_density = compute_population_density(tiles, cso_pop)
-    print(f"  Population density: min={pop_density.min():.1f}, "
-          f"max={pop_density.max():.1f}, mean={pop_density.mean():.1f} per km²")
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Population density: min=%.1f, max=%.1f, mean=%.1f per km²",
+            pop_density.min(),
+            pop_density.max(),
+            pop_density.mean(),
+        )
 
     # ── Step 5: Nearest IDA site ───────────────────────────────────────────
-    print("\n[8/11] Computing nearest IDA site distance...")
+    log.info("[8/11] Computing nearest IDA site distance...")
     ida_km = compute_nearest_ida_km(tiles, engine)
     if ida_km.isna().all():
-        print("  IDA sites not yet populated — skipping distance calculation")
-    else:
-        print(f"  IDA distance: min={ida_km.min():.1f}, max={ida_km.max():.1f} km")
+        log.info("IDA sites not yet populated — skipping distance calculation")
+        ida_km = None
+    elif log.isEnabledFor(logging.INFO):
+        log.info("IDA distance: min=%.1f, max=%.1f km", ida_km.min(), ida_km.max())
 
     # ── Step 6: Land pricing from PPR ──────────────────────────────────────
     land_pricing_df = None
     if has_ppr:
-        print("\n[9/11] Computing land pricing from PPR...")
-        land_pricing_df = compute_land_pricing(tiles, PPR_FILE, OSM_SETTLEMENTS_FILE)
+        log.info("[9/11] Computing land pricing from PPR...")
+        land_pricing_df = compute_land_pricing(tiles, PPR_FILE, OSM_SETTLEMENTS_FILE, engine)
     else:
-        print("\n[9/11] Skipping land pricing (no PPR data)")
+        log.info("[9/11] Skipping land pricing (no PPR data)")
 
     # ── Step 7: Compose scores ─────────────────────────────────────────────
-    print("\n[10/11] Composing planning scores...")
+    log.info("[10/11] Composing planning scores...")
     scores_df = compose_planning_scores(zoning_df, planning_df, pop_density, ida_km, land_pricing_df)
-    print(f"  Score: min={scores_df['score'].min():.2f}, max={scores_df['score'].max():.2f}, "
-          f"mean={scores_df['score'].mean():.2f}")
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Score: min=%.2f, max=%.2f, mean=%.2f",
+            scores_df['score'].min(),
+            scores_df['score'].max(),
+            scores_df['score'].mean(),
+        )
 
     # ── Upsert scores ─────────────────────────────────────────────────────
-    print("\nUpserting planning_scores...")
+    log.info("Upserting planning_scores...")
     n = upsert_planning_scores(scores_df, engine)
-    print(f"  Upserted {n} rows into planning_scores")
+    log.info("Upserted %s rows into planning_scores", n)
 
     # ── Upsert applications ───────────────────────────────────────────────
-    print("\nUpserting tile_planning_applications...")
+    log.info("Upserting tile_planning_applications...")
     n_apps = upsert_planning_applications(planning_df, engine)
-    print(f"  Inserted {n_apps} application rows into tile_planning_applications")
+    log.info("Inserted %s application rows into tile_planning_applications", n_apps)
 
     # ── Upsert pins ───────────────────────────────────────────────────────
-    print("\nUpserting planning pins...")
+    log.info("Upserting planning pins...")
     n_pins = upsert_pins_planning(zoning, applications, engine)
-    print(f"  Inserted {n_pins} planning pins")
+    log.info("Inserted %s planning pins", n_pins)
 
     # ── Write metric_ranges for land pricing + population density ─────────
-    print("\n[11/11] Writing metric ranges...")
+    log.info("[11/11] Writing metric ranges...")
     write_land_price_metric_ranges(scores_df, engine)
     write_population_density_metric_ranges(scores_df, engine)
 
-    print("\n" + "=" * 60)
-    print(f"Planning ingest complete: {n} tiles scored, {n_apps} applications, {n_pins} pins")
+    log.info("=" * 60)
+    log.info(
+        "Planning ingest complete: %s tiles scored, %s applications, %s pins",
+        n,
+        n_apps,
+        n_pins,
+    )
     if has_ppr:
         lp_count = (scores_df["land_price_score"].notna()).sum()
-        print(f"  Land pricing: {lp_count} tiles with price data")
-    print("Next step: run overall/compute_composite.py (after all sort pipelines complete)")
-    print("=" * 60)
+        log.info("Land pricing: %s tiles with price data", lp_count)
+    log.info("Next step: run overall/compute_composite.py (after all sort pipelines complete)")
+    log.info("=" * 60)
 
 
 if __name__ == "__main__":
@@ -2,15 +2,17 @@
 FILE: pipeline/seed_synthetic.py
 Role: Populate all sort tables + metric_ranges with synthetic data for dev/testing.
 Run: python seed_synthetic.py
-Safe to re-run (TRUNCATE + INSERT each sort table).
+Safe to re-run (TRUNCATE + COPY each sort table).
 Data is random but respects all DB CHECK constraints (0–100 ranges, etc.)
 
 Requires tiles table to be populated first (run grid/generate_grid.py).
-Uses numpy.random.seed(42) for reproducibility.
+Uses np.random.default_rng(42); each sort seeder draws from its own spawned stream.
 """
 
+import io
 import math
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -18,9 +20,21 @@ import psycopg2
 from psycopg2.extras import execute_values
 
 sys.path.insert(0, str(Path(__file__).parent))
-from config import DB_URL, INEX_DUBLIN_COORDS, INEX_CORK_COORDS
+from config import DB_URL, EXECUTE_VALUES_PAGE_SIZE, INEX_DUBLIN_COORDS, INEX_CORK_COORDS
 
-np.random.seed(42)
+RNG = np.random.default_rng(42)
+
+# landslide_susceptibility labels (CHECK-constrained) and their draw weights
+SUSCEPTIBILITY_LABELS = ("none", "low", "medium", "high")
+SUSCEPTIBILITY_CDF = np.cumsum([0.60, 0.25, 0.12, 0.03])
+SUSCEPTIBILITY_CDF /= SUSCEPTIBILITY_CDF[-1]
+
+# exclusion_reason codes: 0 = no exclusion (NULL), else the label at that index
+EXCLUSION_REASONS = (None, "SAC overlap", "Current flood zone")
+OVERALL_EXCLUSION_REASONS = (None, "SAC or flood zone")
+
+# Rows packed per binary COPY chunk; bounds the buffer held in memory at once
+COPY_BLOCK_ROWS = 50_000
 
 
 # ---------------------------------------------------------------------------
@@ -28,85 +42,215 @@ np.random.seed(42)
 # ---------------------------------------------------------------------------
 
 def get_conn() -> psycopg2.extensions.connection:
-    return psycopg2.connect(DB_URL)
+    # Dev seed data is regenerable, so don't wait on WAL flush at each commit
+    return psycopg2.connect(DB_URL, options="-c synchronous_commit=off")
 
 
-def haversine_km(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
-    """Great-circle distance in kilometres."""
+def haversine_km_vec(
+    lng: np.ndarray, lat: np.ndarray, lng0: float, lat0: float
+) -> np.ndarray:
+    """Great-circle distance in kilometres from each (lng, lat) to (lng0, lat0)."""
     R = 6371.0
-    dlng = math.radians(lng2 - lng1)
-    dlat = math.radians(lat2 - lat1)
+    dlng = np.radians(lng0 - lng)
+    dlat = np.radians(lat0 - lat)
     a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(math.radians(lat1))
-        * math.cos(math.radians(lat2))
-        * math.sin(dlng / 2) ** 2
+        np.sin(dlat / 2) ** 2
+        + np.cos(np.radians(lat))
+        * math.cos(math.radians(lat0))
+        * np.sin(dlng / 2) ** 2
+    )
+    return 2.0 * R * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _pg_binary_type(a: np.ndarray) -> tuple[str, str]:
+    """PostgreSQL type and big-endian field dtype for sending a via binary COPY."""
+    if a.dtype == np.bool_:
+        return "boolean", "?"
+    if a.dtype.kind in "iu":
+        if a.dtype.itemsize <= 2:
+            return "smallint", ">i2"
+        if a.dtype.itemsize == 4 and a.dtype.kind == "i":
+            return "integer", ">i4"
+        return "bigint", ">i8"
+    return "double precision", ">f8"
+
+
+class _ChunkReader:
+    """Minimal read()-only file over an iterator of byte chunks, for copy_expert."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buf = b""
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            rest = self._buf[self._pos:] + b"".join(self._chunks)
+            self._buf, self._pos = b"", 0
+            return rest
+        if self._pos >= len(self._buf):
+            self._buf, self._pos = next(self._chunks, b""), 0
+        out = self._buf[self._pos:self._pos + size]
+        self._pos += len(out)
+        return out
+
+
+def uniform_columns(
+    rng: np.random.Generator, n: int, bounds: list[tuple[float, float]]
+) -> np.ndarray:
+    """
+    Draw one U(lo, hi) column per (lo, hi) in bounds with a single RNG call.
+    Returns a (len(bounds), n) array; row k is contiguous, so unpacking it
+    yields one ready-to-use column view per bound.
+    """
+    lo, hi = np.asarray(bounds, dtype=np.float64).T
+    u = rng.random((len(bounds), n))
+    u *= (hi - lo)[:, None]
+    u += lo[:, None]
+    return u
+
+
+def copy_rows(cur, table: str, columns: list[str], arrays: list) -> int:
+    """
+    Bulk-load column arrays into table via binary COPY.
+
+    arrays holds one entry per column: a bool/integer/float NumPy array of
+    length n, None for a column that is NULL on every row, or a (codes, labels)
+    pair for a dictionary-encoded text column — integer codes indexing labels,
+    where a None label means NULL.
+
+    NUMERIC has no fixed-width binary form, so rows go into a temp staging
+    table typed from the array dtypes (float8 / int / bool, label codes as
+    int2) and move across in one INSERT ... SELECT. PostgreSQL casts to the
+    column types there (NUMERIC(p,s) rounds to scale) and maps codes to
+    labels. Every staged record is fixed-width, so each COPY_BLOCK_ROWS block
+    is packed with one structured-array assignment per column — no per-row
+    Python and no float-to-text formatting. Returns row count.
+    """
+    stage = f"{table}_stage"
+    sent, stage_cols, select = [], [], []
+    for col, a in zip(columns, arrays):
+        if a is None:
+            select.append("NULL")
+            continue
+        if isinstance(a, tuple):
+            codes, labels = a
+            a = codes.astype(np.int16)
+            select.append(
+                cur.mogrify(f"(%s::text[])[{col} + 1]", (list(labels),)).decode()
+            )
+        else:
+            select.append(col)
+        pg_type, fmt = _pg_binary_type(a)
+        sent.append((col, a))
+        stage_cols.append(f"{col} {pg_type}")
+
+    # Tuple layout: int16 field count, then per field int32 length + value
+    record = np.dtype(
+        [("nfields", ">i2")]
+        + [
+            field
+            for k, (_, a) in enumerate(sent)
+            for field in ((f"len{k}", ">i4"), (f"val{k}", _pg_binary_type(a)[1]))
+        ]
     )
-    return 2.0 * R * math.asin(math.sqrt(min(a, 1.0)))
+    n = len(sent[0][1])
+
+    # One record buffer, allocated once and refilled per block; the field
+    # count and lengths are the same for every row, so they're set up front.
+    block = np.empty(min(COPY_BLOCK_ROWS, n), dtype=record)
+    block["nfields"] = len(sent)
+    for k in range(len(sent)):
+        block[f"len{k}"] = record[f"val{k}"].itemsize
+
+    def chunks():
+        yield b"PGCOPY\n\xff\r\n\x00" + bytes(8)     # signature, flags, ext length
+        for start in range(0, n, COPY_BLOCK_ROWS):
+            rows = block[:min(COPY_BLOCK_ROWS, n - start)]
+            for k, (_, a) in enumerate(sent):
+                rows[f"val{k}"] = a[start:start + len(rows)]
+            yield rows.tobytes()
+        yield b"\xff\xff"                               # file trailer
+
+    cur.execute(
+        f"CREATE TEMP TABLE {stage} ({', '.join(stage_cols)}) ON COMMIT DROP"
+    )
+    sent_cols = ", ".join(col for col, _ in sent)
+    cur.copy_expert(
+        f"COPY {stage} ({sent_cols}) FROM STDIN WITH (FORMAT BINARY)",
+        _ChunkReader(chunks()),
+    )
+    cur.execute(
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"SELECT {', '.join(select)} FROM {stage}"
+    )
+    return n
 
 
-def get_tiles(conn):
-    """Return list of (tile_id, centroid_lng, centroid_lat) for all tiles."""
+def get_tiles(conn) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return (tile_ids, centroid_lng, centroid_lat) arrays for all tiles, ordered
+    by tile_id. Rows are streamed via COPY TO STDOUT straight into typed arrays
+    rather than fetched as a list of Python tuples.
+    """
+    buf = io.StringIO()
     with conn.cursor() as cur:
-        cur.execute(
-            "SELECT tile_id, ST_X(centroid), ST_Y(centroid) FROM tiles ORDER BY tile_id"
+        cur.copy_expert(
+            "COPY (SELECT tile_id, ST_X(centroid), ST_Y(centroid) "
+            "FROM tiles ORDER BY tile_id) TO STDOUT WITH CSV",
+            buf,
         )
-        return cur.fetchall()
+    if buf.tell() == 0:
+        empty = np.empty(0)
+        return empty.astype(np.int32), empty, empty
+    buf.seek(0)
+    arr = np.loadtxt(
+        buf,
+        delimiter=",",
+        dtype=[("tile_id", np.int32), ("lng", np.float64), ("lat", np.float64)],
+        ndmin=1,
+    )
+    return arr["tile_id"], arr["lng"], arr["lat"]
 
 
 # ---------------------------------------------------------------------------
 # Energy scores
 # ---------------------------------------------------------------------------
 
-def seed_energy(conn, tiles) -> dict:
-    n = len(tiles)
-    tile_ids = [t[0] for t in tiles]
-
-    wind_100m = np.random.uniform(4.0, 12.0, n)
-    solar_ghi = np.random.uniform(900.0, 1200.0, n)
-    grid_proximity = np.random.uniform(0.0, 100.0, n)
-    nearest_substation_km = np.random.uniform(0.5, 35.0, n)
-    score = np.random.uniform(0.0, 100.0, n)
-
-    records = []
-    for i in range(n):
-        w = float(wind_100m[i])
-        sub_km = float(nearest_substation_km[i])
-        records.append(
-            (
-                tile_ids[i],
-                round(float(score[i]), 2),
-                round(w * 0.85, 3),         # wind_speed_50m
-                round(w, 3),                # wind_speed_100m
-                round(w * 1.10, 3),         # wind_speed_150m
-                round(float(solar_ghi[i]), 3),
-                round(float(grid_proximity[i]), 2),
-                None,                       # nearest_transmission_line_km
-                round(sub_km, 3),
-                None,                       # nearest_substation_name
-                None,                       # nearest_substation_voltage
-                sub_km > 20.0,              # grid_low_confidence
-            )
-        )
+def seed_energy(conn, tile_ids: np.ndarray, rng: np.random.Generator) -> dict:
+    n = len(tile_ids)
+
+    wind_100m, solar_ghi, grid_proximity, nearest_substation_km, score = uniform_columns(
+        rng, n, [(4.0, 12.0), (900.0, 1200.0), (0.0, 100.0), (0.5, 35.0), (0.0, 100.0)]
+    )
 
     with conn.cursor() as cur:
-        cur.execute("TRUNCATE energy_scores")
-        execute_values(
+        copy_rows(
             cur,
-            """
-            INSERT INTO energy_scores (
-                tile_id, score,
-                wind_speed_50m, wind_speed_100m, wind_speed_150m,
-                solar_ghi, grid_proximity,
-                nearest_transmission_line_km, nearest_substation_km,
-                nearest_substation_name, nearest_substation_voltage,
-                grid_low_confidence
-            ) VALUES %s
-            """,
-            records,
-            page_size=1000,
+            "energy_scores",
+            [
+                "tile_id", "score",
+                "wind_speed_50m", "wind_speed_100m", "wind_speed_150m",
+                "solar_ghi", "grid_proximity",
+                "nearest_transmission_line_km", "nearest_substation_km",
+                "nearest_substation_name", "nearest_substation_voltage",
+                "grid_low_confidence",
+            ],
+            [
+                tile_ids,
+                score,
+                wind_100m * 0.85,
+                wind_100m,
+                wind_100m * 1.10,
+                solar_ghi,
+                grid_proximity,
+                None,                               # nearest_transmission_line_km
+                nearest_substation_km,
+                None,                               # nearest_substation_name
+                None,                               # nearest_substation_voltage
+                nearest_substation_km > 20.0,       # grid_low_confidence
+            ],
         )
-    conn.commit()
     print(f"  energy_scores:       {n:,} rows")
     return {"score": score}
 
@@ -115,75 +259,64 @@ def seed_energy(conn, tiles) -> dict:
 # Environment scores
 # ---------------------------------------------------------------------------
 
-def seed_environment(conn, tiles) -> dict:
-    n = len(tiles)
-    tile_ids = [t[0] for t in tiles]
+def seed_environment(conn, tile_ids: np.ndarray, rng: np.random.Generator) -> dict:
+    n = len(tile_ids)
 
-    rng = np.random.random(n)
-    sac_mask = rng < 0.05                            # ~5% SAC hard exclusions
-    flood_mask = (rng >= 0.05) & (rng < 0.08)       # ~3% flood hard exclusions
+    (
+        u_exclusion, score, designation_overlap, flood_risk, landslide_risk, u_susceptibility
+    ) = uniform_columns(
+        rng, n,
+        [(0.0, 1.0), (40.0, 100.0), (40.0, 100.0), (40.0, 100.0), (40.0, 100.0), (0.0, 1.0)],
+    )
+    sac_mask = u_exclusion < 0.05                               # ~5% SAC hard exclusions
+    flood_mask = (u_exclusion >= 0.05) & (u_exclusion < 0.08)   # ~3% flood hard exclusions
     hard_mask = sac_mask | flood_mask
 
     # Normal tiles: score 40–100; excluded tiles: score 0
-    base_score = np.random.uniform(40.0, 100.0, n)
-    score = np.where(hard_mask, 0.0, base_score)
+    score[hard_mask] = 0.0
+    designation_overlap[hard_mask] = 0.0
+    flood_risk[flood_mask] = 0.0
 
-    designation_overlap = np.where(hard_mask, 0.0, np.random.uniform(40.0, 100.0, n))
-    flood_risk = np.where(flood_mask, 0.0, np.random.uniform(40.0, 100.0, n))
-    landslide_risk = np.random.uniform(40.0, 100.0, n)
+    # Draw int8 codes into SUSCEPTIBILITY_LABELS; strings only appear in COPY
+    susceptibility = np.searchsorted(
+        SUSCEPTIBILITY_CDF, u_susceptibility, side="right"
+    ).astype(np.int8)
 
-    susceptibility = np.random.choice(
-        ["none", "low", "medium", "high"],
-        size=n,
-        p=[0.60, 0.25, 0.12, 0.03],
-    )
-
-    records = []
-    for i in range(n):
-        if sac_mask[i]:
-            exc_reason = "SAC overlap"
-        elif flood_mask[i]:
-            exc_reason = "Current flood zone"
-        else:
-            exc_reason = None
-
-        records.append(
-            (
-                tile_ids[i],
-                round(float(score[i]), 2),
-                round(float(designation_overlap[i]), 2),
-                round(float(flood_risk[i]), 2),
-                round(float(landslide_risk[i]), 2),
-                bool(hard_mask[i]),
-                exc_reason,
-                bool(sac_mask[i]),      # intersects_sac
-                False,                  # intersects_spa
-                False,                  # intersects_nha
-                False,                  # intersects_pnha
-                bool(flood_mask[i]),    # intersects_current_flood
-                False,                  # intersects_future_flood
-                str(susceptibility[i]),
-            )
-        )
+    # int8 codes into EXCLUSION_REASONS; SAC wins where both masks could apply
+    exc_reason = np.zeros(n, dtype=np.int8)
+    exc_reason[flood_mask] = 2
+    exc_reason[sac_mask] = 1
+    no_overlap = np.zeros(n, dtype=bool)
 
     with conn.cursor() as cur:
-        cur.execute("TRUNCATE environment_scores")
-        execute_values(
+        copy_rows(
             cur,
-            """
-            INSERT INTO environment_scores (
-                tile_id, score,
-                designation_overlap, flood_risk, landslide_risk,
-                has_hard_exclusion, exclusion_reason,
-                intersects_sac, intersects_spa, intersects_nha, intersects_pnha,
-                intersects_current_flood, intersects_future_flood,
-                landslide_susceptibility
-            ) VALUES %s
-            """,
-            records,
-            page_size=1000,
+            "environment_scores",
+            [
+                "tile_id", "score",
+                "designation_overlap", "flood_risk", "landslide_risk",
+                "has_hard_exclusion", "exclusion_reason",
+                "intersects_sac", "intersects_spa", "intersects_nha", "intersects_pnha",
+                "intersects_current_flood", "intersects_future_flood",
+                "landslide_susceptibility",
+            ],
+            [
+                tile_ids,
+                score,
+                designation_overlap,
+                flood_risk,
+                landslide_risk,
+                hard_mask,
+                (exc_reason, EXCLUSION_REASONS),
+                sac_mask,       # intersects_sac
+                no_overlap,     # intersects_spa
+                no_overlap,     # intersects_nha
+                no_overlap,     # intersects_pnha
+                flood_mask,     # intersects_current_flood
+                no_overlap,     # intersects_future_flood
+                (susceptibility, SUSCEPTIBILITY_LABELS),
+            ],
         )
-    conn.commit()
     print(
         f"  environment_scores:  {n:,} rows  "
         f"({int(sac_mask.sum())} SAC, {int(flood_mask.sum())} flood exclusions)"
@@ -195,56 +328,43 @@ def seed_environment(conn, tiles) -> dict:
 # Cooling scores
 # ---------------------------------------------------------------------------
 
-def seed_cooling(conn, tiles) -> dict:
-    n = len(tiles)
-    tile_ids = [t[0] for t in tiles]
+def seed_cooling(conn, tile_ids: np.ndarray, rng: np.random.Generator) -> dict:
+    n = len(tile_ids)
 
-    temperature = np.random.uniform(8.5, 13.5, n)
-    rainfall = np.random.uniform(700.0, 2500.0, n)
-    water_proximity = np.random.uniform(20.0, 100.0, n)
-    aquifer_productivity = np.random.uniform(10.0, 90.0, n)
-    # Rough free-cooling hours estimate: hours/yr below 18°C
-    free_cooling_hours = np.array(
-        [int(8760 * (14.0 - float(t)) / 14.0) for t in temperature], dtype=float
+    temperature, rainfall, water_proximity, aquifer_productivity, score = uniform_columns(
+        rng, n, [(8.5, 13.5), (700.0, 2500.0), (20.0, 100.0), (10.0, 90.0), (40.0, 90.0)]
     )
-    score = np.random.uniform(40.0, 90.0, n)
-
-    records = [
-        (
-            tile_ids[i],
-            round(float(score[i]), 2),
-            round(float(temperature[i]), 2),
-            round(float(water_proximity[i]), 2),
-            round(float(rainfall[i]), 2),
-            round(float(aquifer_productivity[i]), 2),
-            float(free_cooling_hours[i]),
-            None,   # nearest_waterbody_name
-            None,   # nearest_waterbody_km
-            None,   # nearest_hydrometric_station_name
-            None,   # nearest_hydrometric_flow_m3s
-            None,   # aquifer_productivity_rating
-        )
-        for i in range(n)
-    ]
+    # Rough free-cooling hours estimate: hours/yr below 18°C
+    # (truncated to whole hours, as int() did per tile before)
+    free_cooling_hours = np.trunc(8760.0 * (14.0 - temperature) / 14.0)
 
     with conn.cursor() as cur:
-        cur.execute("TRUNCATE cooling_scores")
-        execute_values(
+        copy_rows(
             cur,
-            """
-            INSERT INTO cooling_scores (
-                tile_id, score,
-                temperature, water_proximity, rainfall, aquifer_productivity,
+            "cooling_scores",
+            [
+                "tile_id", "score",
+                "temperature", "water_proximity", "rainfall", "aquifer_productivity",
+                "free_cooling_hours",
+                "nearest_waterbody_name", "nearest_waterbody_km",
+                "nearest_hydrometric_station_name", "nearest_hydrometric_flow_m3s",
+                "aquifer_productivity_rating",
+            ],
+            [
+                tile_ids,
+                score,
+                temperature,
+                water_proximity,
+                rainfall,
+                aquifer_productivity,
                 free_cooling_hours,
-                nearest_waterbody_name, nearest_waterbody_km,
-                nearest_hydrometric_station_name, nearest_hydrometric_flow_m3s,
-                aquifer_productivity_rating
-            ) VALUES %s
-            """,
-            records,
-            page_size=1000,
+                None,   # nearest_waterbody_name
+                None,   # nearest_waterbody_km
+                None,   # nearest_hydrometric_station_name
+                None,   # nearest_hydrometric_flow_m3s
+                None,   # aquifer_productivity_rating
+            ],
         )
-    conn.commit()
     print(f"  cooling_scores:      {n:,} rows")
     return {"score": score}
 
@@ -253,68 +373,60 @@ def seed_cooling(conn, tiles) -> dict:
 # Connectivity scores
 # ---------------------------------------------------------------------------
 
-def seed_connectivity(conn, tiles) -> dict:
-    n = len(tiles)
-    tile_ids = [t[0] for t in tiles]
+def seed_connectivity(
+    conn,
+    tile_ids: np.ndarray,
+    lng: np.ndarray,
+    lat: np.ndarray,
+    rng: np.random.Generator,
+) -> dict:
+    n = len(tile_ids)
 
     inex_dub_lng, inex_dub_lat = INEX_DUBLIN_COORDS
     inex_cor_lng, inex_cor_lat = INEX_CORK_COORDS
 
-    inex_dublin_km = np.array(
-        [haversine_km(t[1], t[2], inex_dub_lng, inex_dub_lat) for t in tiles]
-    )
-    inex_cork_km = np.array(
-        [haversine_km(t[1], t[2], inex_cor_lng, inex_cor_lat) for t in tiles]
-    )
+    inex_dublin_km = haversine_km_vec(lng, lat, inex_dub_lng, inex_dub_lat)
+    inex_cork_km = haversine_km_vec(lng, lat, inex_cor_lng, inex_cor_lat)
 
     # Inverse log-distance score — 0 km → 100, ~300 km → 0
-    min_ix_km = np.minimum(inex_dublin_km, inex_cork_km)
-    ix_distance = np.clip(
-        100.0 * (1.0 - np.log(1.0 + min_ix_km) / math.log(301.0)),
-        0.0,
-        100.0,
+    # (built in place in the min-distance buffer, no per-step temporaries)
+    ix_distance = np.minimum(inex_dublin_km, inex_cork_km)
+    np.log1p(ix_distance, out=ix_distance)
+    ix_distance *= -100.0 / math.log(301.0)
+    ix_distance += 100.0
+    np.clip(ix_distance, 0.0, 100.0, out=ix_distance)
+
+    broadband, road_access, score = uniform_columns(
+        rng, n, [(20.0, 95.0), (30.0, 95.0), (30.0, 90.0)]
     )
 
-    broadband = np.random.uniform(20.0, 95.0, n)
-    road_access = np.random.uniform(30.0, 95.0, n)
-    score = np.random.uniform(30.0, 90.0, n)
-
-    records = [
-        (
-            tile_ids[i],
-            round(float(score[i]), 2),
-            round(float(broadband[i]), 2),
-            round(float(ix_distance[i]), 2),
-            round(float(road_access[i]), 2),
-            round(float(inex_dublin_km[i]), 3),
-            round(float(inex_cork_km[i]), 3),
-            None,   # broadband_tier
-            None,   # nearest_motorway_junction_km
-            None,   # nearest_motorway_junction_name
-            None,   # nearest_national_road_km
-            None,   # nearest_rail_freight_km
-        )
-        for i in range(n)
-    ]
-
     with conn.cursor() as cur:
-        cur.execute("TRUNCATE connectivity_scores")
-        execute_values(
+        copy_rows(
             cur,
-            """
-            INSERT INTO connectivity_scores (
-                tile_id, score,
-                broadband, ix_distance, road_access,
-                inex_dublin_km, inex_cork_km,
-                broadband_tier,
-                nearest_motorway_junction_km, nearest_motorway_junction_name,
-                nearest_national_road_km, nearest_rail_freight_km
-            ) VALUES %s
-            """,
-            records,
-            page_size=1000,
+            "connectivity_scores",
+            [
+                "tile_id", "score",
+                "broadband", "ix_distance", "road_access",
+                "inex_dublin_km", "inex_cork_km",
+                "broadband_tier",
+                "nearest_motorway_junction_km", "nearest_motorway_junction_name",
+                "nearest_national_road_km", "nearest_rail_freight_km",
+            ],
+            [
+                tile_ids,
+                score,
+                broadband,
+                ix_distance,
+                road_access,
+                inex_dublin_km,
+                inex_cork_km,
+                None,   # broadband_tier
+                None,   # nearest_motorway_junction_km
+                None,   # nearest_motorway_junction_name
+                None,   # nearest_national_road_km
+                None,   # nearest_rail_freight_km
+            ],
         )
-    conn.commit()
     print(f"  connectivity_scores: {n:,} rows")
     return {"score": score}
 
@@ -323,75 +435,71 @@ def seed_connectivity(conn, tiles) -> dict:
 # Planning scores
 # ---------------------------------------------------------------------------
 
-def seed_planning(conn, tiles) -> dict:
-    n = len(tiles)
-    tile_ids = [t[0] for t in tiles]
+def seed_planning(conn, tile_ids: np.ndarray, rng: np.random.Generator) -> dict:
+    n = len(tile_ids)
 
-    pct_industrial = np.random.uniform(0.0, 25.0, n)
-    pct_enterprise = np.random.uniform(0.0, 25.0, n)
-    pct_residential = np.random.uniform(0.0, 10.0, n)
-    pct_mixed_use = np.random.uniform(0.0, 15.0, n)
-    pct_other = np.random.uniform(0.0, 5.0, n)
-    # Agricultural absorbs the remainder (floor at 0)
-    pct_agricultural = np.maximum(
-        0.0,
-        100.0 - pct_industrial - pct_enterprise - pct_residential - pct_mixed_use - pct_other,
+    (
+        pct_industrial, pct_enterprise, pct_residential, pct_mixed_use, pct_other,
+        planning_precedent, avg_price_per_sqm,
+    ) = uniform_columns(
+        rng, n,
+        [(0.0, 25.0), (0.0, 25.0), (0.0, 10.0), (0.0, 15.0), (0.0, 5.0), (0.0, 60.0), (1000.0, 8000.0)],
     )
-
-    zoning_tier = np.clip((pct_industrial + pct_enterprise) * 0.9, 0.0, 100.0)
-    planning_precedent = np.random.uniform(0.0, 60.0, n)
+    # Industrial + enterprise feeds both the remainder and the zoning tier:
+    # sum it once, then build each derived column in place.
+    sum_ie = pct_industrial + pct_enterprise
+    # Agricultural absorbs the remainder (floor at 0)
+    pct_agricultural = 100.0 - sum_ie
+    pct_agricultural -= pct_residential
+    pct_agricultural -= pct_mixed_use
+    pct_agricultural -= pct_other
+    np.maximum(pct_agricultural, 0.0, out=pct_agricultural)
+
+    zoning_tier = np.multiply(sum_ie, 0.9, out=sum_ie)
+    np.clip(zoning_tier, 0.0, 100.0, out=zoning_tier)
     # Synthetic land pricing: price/m² varies by "desirability" (higher zoning_tier → higher demand → higher price)
-    avg_price_per_sqm = np.random.uniform(1000, 8000, n) + zoning_tier * 30
+    avg_price_per_sqm += zoning_tier * 30
     land_price_score = np.clip(
         100 - (avg_price_per_sqm - avg_price_per_sqm.min()) / max(avg_price_per_sqm.max() - avg_price_per_sqm.min(), 1) * 100,
         0, 100,
     )
-    transaction_count = np.random.randint(0, 200, n)
-    score = np.clip(
-        zoning_tier * 0.42 + land_price_score * 0.28 + planning_precedent * 0.3,
-        0.0, 100.0,
-    )
-
-    records = [
-        (
-            tile_ids[i],
-            round(float(score[i]), 2),
-            round(float(zoning_tier[i]), 2),
-            round(float(planning_precedent[i]), 2),
-            round(float(pct_industrial[i]), 2),
-            round(float(pct_enterprise[i]), 2),
-            round(float(pct_mixed_use[i]), 2),
-            round(float(pct_agricultural[i]), 2),
-            round(float(pct_residential[i]), 2),
-            round(float(pct_other[i]), 2),
-            None,   # nearest_ida_site_km
-            None,   # population_density_per_km2
-            None,   # county_dev_plan_ref
-            round(float(land_price_score[i])),
-            round(float(avg_price_per_sqm[i]), 2),
-            int(transaction_count[i]),
-        )
-        for i in range(n)
-    ]
+    transaction_count = rng.integers(0, 200, n)
+    score = zoning_tier * 0.42
+    score += land_price_score * 0.28
+    score += planning_precedent * 0.3
+    np.clip(score, 0.0, 100.0, out=score)
 
     with conn.cursor() as cur:
-        cur.execute("TRUNCATE planning_scores")
-        execute_values(
+        copy_rows(
             cur,
-            """
-            INSERT INTO planning_scores (
-                tile_id, score,
-                zoning_tier, planning_precedent,
-                pct_industrial, pct_enterprise, pct_mixed_use,
-                pct_agricultural, pct_residential, pct_other,
-                nearest_ida_site_km, population_density_per_km2, county_dev_plan_ref,
-                land_price_score, avg_price_per_sqm_eur, transaction_count
-            ) VALUES %s
-            """,
-            records,
-            page_size=1000,
+            "planning_scores",
+            [
+                "tile_id", "score",
+                "zoning_tier", "planning_precedent",
+                "pct_industrial", "pct_enterprise", "pct_mixed_use",
+                "pct_agricultural", "pct_residential", "pct_other",
+                "nearest_ida_site_km", "population_density_per_km2", "county_dev_plan_ref",
+                "land_price_score", "avg_price_per_sqm_eur", "transaction_count",
+            ],
+            [
+                tile_ids,
+                score,
+                zoning_tier,
+                planning_precedent,
+                pct_industrial,
+                pct_enterprise,
+                pct_mixed_use,
+                pct_agricultural,
+                pct_residential,
+                pct_other,
+                None,   # nearest_ida_site_km
+                None,   # population_density_per_km2
+                None,   # county_dev_plan_ref
+                np.rint(land_price_score).astype(np.int16),  # SMALLINT
+                np.round(avg_price_per_sqm, 2),     # REAL — rounded here
+                transaction_count,
+            ],
         )
-    conn.commit()
     print(f"  planning_scores:     {n:,} rows")
     return {"score": score}
 
@@ -402,15 +510,14 @@ def seed_planning(conn, tiles) -> dict:
 
 def seed_overall(
     conn,
-    tiles,
+    tile_ids: np.ndarray,
     energy_data: dict,
     env_data: dict,
     cooling_data: dict,
     conn_data: dict,
     plan_data: dict,
 ) -> None:
-    n = len(tiles)
-    tile_ids = [t[0] for t in tiles]
+    n = len(tile_ids)
 
     # Read weights from DB (single row enforced by CHECK constraint)
     with conn.cursor() as cur:
@@ -432,48 +539,39 @@ def seed_overall(
     p_s = plan_data["score"]
     hard_mask = env_data["hard_mask"]
 
-    weighted = (
-        e_s * w_energy
-        + env_s * w_env
-        + c_s * w_cool
-        + cn_s * w_conn
-        + p_s * w_plan
-    )
-    overall_score = np.where(hard_mask, 0.0, np.clip(weighted, 0.0, 100.0))
-
-    records = [
-        (
-            tile_ids[i],
-            round(float(overall_score[i]), 2),
-            round(float(e_s[i]), 2),
-            round(float(env_s[i]), 2),
-            round(float(c_s[i]), 2),
-            round(float(cn_s[i]), 2),
-            round(float(p_s[i]), 2),
-            bool(hard_mask[i]),
-            "SAC or flood zone" if hard_mask[i] else None,
-            None,   # nearest_data_centre_km
-        )
-        for i in range(n)
-    ]
+    # Accumulate in one buffer so each term reuses it instead of a fresh array
+    overall_score = e_s * w_energy
+    overall_score += env_s * w_env
+    overall_score += c_s * w_cool
+    overall_score += cn_s * w_conn
+    overall_score += p_s * w_plan
+    np.clip(overall_score, 0.0, 100.0, out=overall_score)
+    overall_score[hard_mask] = 0.0
 
     with conn.cursor() as cur:
-        cur.execute("TRUNCATE overall_scores")
-        execute_values(
+        copy_rows(
             cur,
-            """
-            INSERT INTO overall_scores (
-                tile_id, score,
-                energy_score, environment_score, cooling_score,
-                connectivity_score, planning_score,
-                has_hard_exclusion, exclusion_reason,
-                nearest_data_centre_km
-            ) VALUES %s
-            """,
-            records,
-            page_size=1000,
+            "overall_scores",
+            [
+                "tile_id", "score",
+                "energy_score", "environment_score", "cooling_score",
+                "connectivity_score", "planning_score",
+                "has_hard_exclusion", "exclusion_reason",
+                "nearest_data_centre_km",
+            ],
+            [
+                tile_ids,
+                overall_score,
+                e_s,
+                env_s,
+                c_s,
+                cn_s,
+                p_s,
+                hard_mask,
+                (hard_mask.view(np.int8), OVERALL_EXCLUSION_REASONS),
+                None,   # nearest_data_centre_km
+            ],
         )
-    conn.commit()
     print(
         f"  overall_scores:      {n:,} rows  "
         f"({int(hard_mask.sum())} zero-scored exclusions)"
@@ -507,8 +605,8 @@ def seed_metric_ranges(conn) -> None:
                 updated_at = now()
             """,
             ranges,
+            page_size=min(len(ranges), EXECUTE_VALUES_PAGE_SIZE),
         )
-    conn.commit()
     print(f"  metric_ranges:       {len(ranges)} rows upserted")
 
 
@@ -550,9 +648,9 @@ def seed_ida_sites(conn) -> None:
             VALUES %s
             """,
             sites,
+            page_size=min(len(sites), EXECUTE_VALUES_PAGE_SIZE),
             template="(ST_GeomFromEWKT(%s), %s, %s, %s, %s)",
         )
-    conn.commit()
     print(f"  ida_sites:           {len(sites)} rows")
 
 
@@ -589,9 +687,9 @@ def seed_pins_overall(conn) -> None:
             VALUES %s
             """,
             pins,
+            page_size=min(len(pins), EXECUTE_VALUES_PAGE_SIZE),
             template="(ST_GeomFromEWKT(%s), %s, %s, %s, %s, %s)",
         )
-    conn.commit()
     print(f"  pins_overall:        {len(pins)} rows")
 
 
@@ -599,6 +697,23 @@ def seed_pins_overall(conn) -> None:
 # Entry point
 # ---------------------------------------------------------------------------
 
+def _seed_on_own_conn(seed_fn, *args) -> dict:
+    """
+    Run one sort seeder on a dedicated connection so seeders can overlap.
+    The seeder's COPY is committed once here; on error it is rolled back.
+    """
+    conn = get_conn()
+    try:
+        result = seed_fn(conn, *args)
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def main():
     print("=" * 60)
     print("Synthetic data seed — all sort tables")
@@ -608,8 +723,8 @@ def main():
     conn = get_conn()
 
     print("Reading tiles...")
-    tiles = get_tiles(conn)
-    n = len(tiles)
+    tile_ids, lng, lat = get_tiles(conn)
+    n = len(tile_ids)
     print(f"  Found {n:,} tiles")
 
     if n == 0:
@@ -617,21 +732,44 @@ def main():
         conn.close()
         sys.exit(1)
 
+    # Clear all six sort tables in one statement, committed before the
+    # concurrent COPY phase so TRUNCATE's exclusive locks are already released.
+    with conn.cursor() as cur:
+        cur.execute(
+            "TRUNCATE energy_scores, environment_scores, cooling_scores, "
+            "connectivity_scores, planning_scores, overall_scores"
+        )
+    conn.commit()
+
     print("\nSeeding sort score tables...")
-    energy_data = seed_energy(conn, tiles)
-    env_data = seed_environment(conn, tiles)
-    cooling_data = seed_cooling(conn, tiles)
-    conn_data = seed_connectivity(conn, tiles)
-    plan_data = seed_planning(conn, tiles)
+    # The five sort seeders are independent: run them concurrently, each on
+    # its own connection and its own RNG stream (spawned from RNG so the
+    # output doesn't depend on thread scheduling).
+    energy_rng, env_rng, cooling_rng, conn_rng, plan_rng = RNG.spawn(5)
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        energy_fut = ex.submit(_seed_on_own_conn, seed_energy, tile_ids, energy_rng)
+        env_fut = ex.submit(_seed_on_own_conn, seed_environment, tile_ids, env_rng)
+        cooling_fut = ex.submit(_seed_on_own_conn, seed_cooling, tile_ids, cooling_rng)
+        conn_fut = ex.submit(
+            _seed_on_own_conn, seed_connectivity, tile_ids, lng, lat, conn_rng
+        )
+        plan_fut = ex.submit(_seed_on_own_conn, seed_planning, tile_ids, plan_rng)
+    energy_data = energy_fut.result()
+    env_data = env_fut.result()
+    cooling_data = cooling_fut.result()
+    conn_data = conn_fut.result()
+    plan_data = plan_fut.result()
 
     print("\nSeeding composite scores...")
-    seed_overall(conn, tiles, energy_data, env_data, cooling_data, conn_data, plan_data)
+    seed_overall(conn, tile_ids, energy_data, env_data, cooling_data, conn_data, plan_data)
 
     print("\nSeeding reference tables...")
     seed_metric_ranges(conn)
     seed_ida_sites(conn)
     seed_pins_overall(conn)
 
+    # overall_scores and the reference tables land in one transaction
+    conn.commit()
     conn.close()
     print(f"\nSynthetic seed complete — {n:,} tiles across all 6 sort tables.")
     print("Martin tiles should now return non-empty MVT responses.")